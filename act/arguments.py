@@ -2,6 +2,7 @@ from collections import OrderedDict
 from functools import cached_property
 from dataclasses import dataclass, field
 from operator import attrgetter
+from types import MappingProxyType
 from typing import (
     Final, Generic, Iterable, Optional, Tuple, Self, Any, Callable, TypeVar,
     Iterator, Mapping
@@ -14,9 +15,7 @@ from act.atomization import fun
 from act.errors import ArgumentError
 from act.partiality import partial
 from act.representations import code_like_repr_of
-from act.structures import (
-    without, frozendict, tmap, without_duplicates, table
-)
+from act.structures import without, frozendict, tmap
 from act.tools import documenting_by, Decorator
 
 
@@ -128,15 +127,18 @@ class Arguments(Mapping, Generic[A]):
     Searches for an argument value by an `ArgumentKey` passed via `[]`.
     """
 
+    __slots__ = ("_args", "_kwargs", "_frozen_kwargs", "_keys", "_key_by_value")
+
     def __init__(
         self,
         args: Iterable[A] = tuple(),
         kwargs: Optional[Mapping[str, A]] = None,
     ):
-        self._args = tuple(args)
-        self._kwargs = frozendict(
-            kwargs if kwargs is not None else dict()
-        )
+        self._args = args if type(args) is tuple else tuple(args)
+        self._kwargs = _EMPTY_KWARGS if not kwargs else dict(kwargs)
+        self._frozen_kwargs = None
+        self._keys = None
+        self._key_by_value = None
 
     @property
     def args(self) -> Tuple[A]:
@@ -144,64 +146,86 @@ class Arguments(Mapping, Generic[A]):
 
     @property
     def kwargs(self) -> frozendict[str, A]:
-        return self._kwargs
+        if self._frozen_kwargs is None:
+            self._frozen_kwargs = frozendict(self._kwargs)
 
-    @cached_property
+        return self._frozen_kwargs
+
+    @property
     def keys(self) -> ArgumentKeys:
-        return ArgumentKeys((
-            *map(ArgumentKey, range(len(self.args))),
-            *(
-                ArgumentKey(key, default=value, is_keyword=True)
-                for key, value in self.kwargs.items()
-            ),
-        ))
+        if self._keys is None:
+            self._keys = ArgumentKeys((
+                *map(ArgumentKey, range(len(self._args))),
+                *(
+                    ArgumentKey(key, default=value, is_keyword=True)
+                    for key, value in self._kwargs.items()
+                ),
+            ))
+
+        return self._keys
 
     def values(self) -> Tuple[A]:
         return (*self._args, *self._kwargs.values())
 
     def items(self) -> Tuple[tuple[int | str, A]]:
-        return self.__items
+        return (*enumerate(self._args), *self._kwargs.items())
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}{str(self)}"
 
     def __str__(self) -> str:
         return "({}{}{})".format(
-            ', '.join(map(str, self.args)),
+            ', '.join(map(str, self._args)),
             (
-                ', ' if self.args and self.kwargs else str()
+                ', ' if self._args and self._kwargs else str()
             ),
             ', '.join(map(
                 lambda item: f"{item[0]}={item[1]}",
-                self.kwargs.items())
+                self._kwargs.items())
             ),
         )
 
     def __eq__(self, other: Special[Self]) -> bool:
         return (
             isinstance(other, Arguments)
-            and self.args == other.args
-            and self.kwargs == other.kwargs
+            and self._args == other._args
+            and self._kwargs == other._kwargs
         )
 
+    def __getstate__(self) -> tuple[Tuple[A], dict[str, A]]:
+        return (self._args, dict(self._kwargs))
+
+    def __setstate__(self, state: tuple[Tuple[A], dict[str, A]]) -> None:
+        self.__init__(*state)
+
     def __getitem__(self, key: ArgumentKey | int | str) -> A:
         if isinstance(key, int | str):
-            key = ArgumentKey(key, is_keyword=isinstance(key, str))
+            return (self._kwargs if isinstance(key, str) else self._args)[key]
+
+        if key.is_keyword:
+            return (
+                self._kwargs[key.value]
+                if key.default is _EMPTY_DEFAULT_VALUE or key.value in self._kwargs
+                else key.default
+            )
 
         return (
-            (self.kwargs if key.is_keyword else self.args)[key.value]
-            if key in self.keys or key.default is _EMPTY_DEFAULT_VALUE
+            self._args[key.value]
+            if (
+                key.default is _EMPTY_DEFAULT_VALUE
+                or 0 <= key.value < len(self._args)
+            )
             else key.default
         )
 
     def __iter__(self) -> Iterator[A]:
-        return iter(self.args)
+        return iter(self._args)
 
     def __len__(self) -> int:
-        return len(self.keys)
+        return len(self._args) + len(self._kwargs)
 
     def __contains__(self, value: A) -> bool:
-        return value in self.args or value in self.kwargs.values()
+        return value in self._args or value in self._kwargs.values()
 
     def __or__(self, other: Self) -> Self:
         return self.expanded_with(other)
@@ -209,17 +233,19 @@ class Arguments(Mapping, Generic[A]):
     def expanded_with(self, other: Self) -> Self:
         """Method to create another pack from an input."""
 
-        return type(self)((*self.args, *other.args), self.kwargs | other.kwargs)
+        return type(self)(
+            (*self._args, *other._args),
+            self._kwargs | other._kwargs,
+        )
 
     def only_with(self, *arguments_or_keys: A | ArgumentKey) -> Self:
         """Method for cloning with values obtained from input keys."""
 
-        keys = tmap(self._as_key, without_duplicates(arguments_or_keys))
-        keyword_keys = ArgumentKeys(keys).keywords
+        keys = tuple(dict.fromkeys(map(self._as_key, arguments_or_keys)))
 
         return type(self)(
-            tuple(self[key] for key in without(*keyword_keys)(keys)),
-            {keyword_key.value: self[keyword_key] for keyword_key in keyword_keys},
+            tuple(self[key] for key in keys if not key.is_keyword),
+            {key.value: self[key] for key in keys if key.is_keyword},
         )
 
     def without(self, *arguments_or_keys: A | ArgumentKey) -> Self:
@@ -228,7 +254,20 @@ class Arguments(Mapping, Generic[A]):
         this method.
         """
 
-        return self.only_with(*without(*arguments_or_keys)(self.keys))
+        keys_to_exclude = set(map(self._as_key, arguments_or_keys))
+
+        return type(self)(
+            tuple(
+                arg
+                for position, arg in enumerate(self._args)
+                if ArgumentKey(position) not in keys_to_exclude
+            ),
+            {
+                keyword: arg
+                for keyword, arg in self._kwargs.items()
+                if ArgumentKey(keyword, is_keyword=True) not in keys_to_exclude
+            },
+        )
 
     def call(self, caller: Callable) -> Any:
         """
@@ -236,7 +275,7 @@ class Arguments(Mapping, Generic[A]):
         instance.
         """
 
-        return caller(*self.args, **self.kwargs)
+        return caller(*self._args, **self._kwargs)
 
     @classmethod
     def of(cls, *args, **kwargs) -> Self:
@@ -249,15 +288,43 @@ class Arguments(Mapping, Generic[A]):
             return value
 
         try:
-            key_of = partial(ArgumentKey, self.args.index(value))
-        except ValueError:
-            key_of = partial(ArgumentKey, table.reversed(self.kwargs)[value])
+            key_value = self._key_by_value_table().get(value, _NO_KEY)
+        except TypeError:
+            key_value = _NO_KEY
+
+        if key_value is _NO_KEY:
+            key_value = next(
+                (key for key, arg in self.items() if arg == value),
+                _NO_KEY,
+            )
+
+        if key_value is _NO_KEY:
+            raise KeyError(value)
+
+        return ArgumentKey(
+            key_value,
+            is_keyword=isinstance(key_value, str),
+            default=value,
+        )
 
-        return key_of(default=value)
+    def _key_by_value_table(self) -> dict[A, int | str]:
+        if self._key_by_value is None:
+            key_by_value = dict()
 
-    @cached_property
-    def __items(self) -> Tuple[tuple[int | str, A]]:
-        return (*zip(range(len(self._args)), self._args), *self._kwargs.items())
+            for key, value in reversed(self.items()):
+                try:
+                    key_by_value[value] = key
+                except TypeError:
+                    continue
+
+            self._key_by_value = key_by_value
+
+        return self._key_by_value
+
+
+_EMPTY_KWARGS: Final[Mapping[str, Any]] = MappingProxyType(dict())
+
+_NO_KEY: Final[object] = object()
 
 
 def as_arguments(*args, **kwargs) -> Arguments:
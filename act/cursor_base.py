@@ -1,11 +1,17 @@
+from collections import OrderedDict
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import reduce, wraps
+from keyword import iskeyword
+from threading import Lock
 from typing import (
-    Iterable, Callable, Any, Mapping, Self, Tuple, Optional, Literal
+    Iterable, Callable, Any, Mapping, Self, Tuple, Optional, Literal, TypeAlias,
+    Sequence, NamedTuple
 )
+import ast
 import operator
+import sys
 
 from pyannotating import Special
 
@@ -21,7 +27,6 @@ from act.partiality import flipped, rpartial, will, partial
 from act.pipeline import ActionChain, bind_by, on, then, _generating_pipeline
 from act.representations import code_like_repr_of
 from act.scoping import value_in
-from act.structures import tmap, tfilter
 from act.synonyms import with_keyword, tuple_of
 
 
@@ -31,6 +36,29 @@ class _OperationModel:
     priority: int | float
 
 
+@dataclass(frozen=True, eq=False)
+class _ActionCursorParameterNode:
+    name: str
+
+
+@dataclass(frozen=True, eq=False)
+class _ActionCursorValueNode:
+    value: Any
+
+
+@dataclass(frozen=True, eq=False)
+class _ActionCursorApplicationNode:
+    action: Callable
+    operands: tuple["_ActionCursorNode", ...] = field(default_factory=tuple)
+
+
+_ActionCursorNode: TypeAlias = (
+    _ActionCursorParameterNode
+    | _ActionCursorValueNode
+    | _ActionCursorApplicationNode
+)
+
+
 class _ActionCursorParameterUnionType(Enum):
     POSITIONAL = auto()
     KEYWORD = auto()
@@ -66,6 +94,38 @@ class _ActionCursorUnpacking:
         return self
 
 
+class _ActionCursorPartialApplication:
+    """
+    Cursor call with not enough positional arguments waiting for the rest of
+    them.
+    """
+
+    __slots__ = (
+        "_cursor", "_args", "_kwargs", "_missing_arity", "_compiled_action"
+    )
+
+    def __init__(self, cursor: "_ActionCursor", args: tuple, kwargs: dict):
+        self._cursor = cursor
+        self._args = args
+        self._kwargs = kwargs
+        self._missing_arity = len(cursor._regular_parameters) - len(args)
+        self._compiled_action = cursor._get_compiled_action()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if (
+            self._missing_arity == len(args)
+            and not kwargs
+            and self._compiled_action is not None
+        ):
+            return self._compiled_action(self._kwargs, *self._args, *args)
+
+        return self._cursor._run(
+            self._args + args,
+            self._kwargs | kwargs,
+            keyword_union_parameter=self._cursor._keyword_union_parameter,
+        )
+
+
 @val
 class _ActionCursorNature:
     attrgetting = flag_about("attrgetting")
@@ -92,6 +152,7 @@ class _ActionCursorNature:
 class _ActionCursor(Mapping):
     _unpacking_key_template: str = "__ActionCursor_keyword_unpacking"
     _sign: bool = False
+    _reserved_names_by_type: dict[type, frozenset[str]] = dict()
 
     def __init__(
         self,
@@ -102,21 +163,59 @@ class _ActionCursor(Mapping):
         nature: contextual = contextual(
             _ActionCursorNature.set_by_initialization,
         ),
-        internal_repr: str = '...',
+        internal_repr: str | Callable[[], str] = '...',
         is_generator_on_call: bool = False,
         is_call_generator_static: bool = False,
+        node: Optional[_ActionCursorNode] = None,
     ):
         self._parameters = tuple(sorted(
             set(parameters),
             key=operator.attrgetter("priority"),
             reverse=True,
         ))
+        self._regular_parameters = tuple(
+            parameter
+            for parameter in self._parameters
+            if parameter.union_type is None
+        )
+        self._positional_union_parameter = next(
+            (
+                parameter
+                for parameter in self._parameters
+                if parameter.union_type is _ActionCursorParameterUnionType.POSITIONAL
+            ),
+            None,
+        )
+        self._keyword_union_parameter = next(
+            (
+                parameter
+                for parameter in self._parameters
+                if parameter.union_type is _ActionCursorParameterUnionType.KEYWORD
+            ),
+            None,
+        )
         self._actions = actions
         self._previous = previous
         self._nature = nature
-        self._internal_repr = internal_repr
+        self._internal_repr_source = internal_repr
         self._is_generator_on_call = is_generator_on_call
         self._is_call_generator_static = is_call_generator_static
+        self._node = (
+            _ActionCursorValueNode(None)
+            if node is None and len(actions) == 0
+            else node
+        )
+        self._compiled_action = None
+        self._compiled_action_arity = None
+        self._was_compiled = False
+        self._compiled_column_actions = None
+
+    @property
+    def _internal_repr(self) -> str:
+        if not isinstance(self._internal_repr_source, str):
+            self._internal_repr_source = self._internal_repr_source()
+
+        return self._internal_repr_source
 
     @property
     def _adapted_internal_repr(self) -> str:
@@ -127,28 +226,55 @@ class _ActionCursor(Mapping):
         return self.__get_adapted_internal_repr(single=True)
 
     def _get_positional_union_parameter(self) -> Optional[_ActionCursorParameter]:
-        positional_union_parameters = tfilter(
-            lambda p: p.union_type is _ActionCursorParameterUnionType.POSITIONAL,
-            self._parameters,
-        )
-
-        return (
-            None
-            if len(positional_union_parameters) == 0
-            else positional_union_parameters[0]
-        )
+        return self._positional_union_parameter
 
     def _get_keyword_union_parameter(self) -> Optional[_ActionCursorParameter]:
-        keyword_union_parameters = tfilter(
-            lambda p: p.union_type is _ActionCursorParameterUnionType.KEYWORD,
-            self._parameters,
-        )
+        return self._keyword_union_parameter
+
+    def _get_compiled_action(self) -> Optional[Callable]:
+        if not self._was_compiled:
+            self._compiled_action = (
+                None
+                if self._node is None
+                else _compiled_action_of(self._node, self._parameters)
+            )
+            self._was_compiled = True
 
-        return (
-            None
-            if len(keyword_union_parameters) == 0
-            else keyword_union_parameters[0]
-        )
+            if (
+                self._compiled_action is not None
+                and len(self._actions) != 0
+                and not self._is_generator_on_call
+            ):
+                self._compiled_action_arity = len(self._regular_parameters)
+
+        return self._compiled_action
+
+    def _get_compiled_column_action(
+        self,
+        *,
+        is_vectorized: bool = False,
+    ) -> Optional[Callable]:
+        if self._compiled_column_actions is None:
+            self._compiled_column_actions = dict()
+
+        if is_vectorized not in self._compiled_column_actions:
+            if self._node is None:
+                compiled_action = None
+            elif is_vectorized:
+                compiled_action = _compiled_action_of(
+                    self._node,
+                    self._parameters,
+                    is_vectorized=True,
+                )
+            else:
+                compiled_action = _compiled_column_action_of(
+                    self._node,
+                    self._regular_parameters,
+                )
+
+            self._compiled_column_actions[is_vectorized] = compiled_action
+
+        return self._compiled_column_actions[is_vectorized]
 
     def __repr__(self) -> str:
         return f"({self._get_raw_repr()})"
@@ -170,6 +296,9 @@ class _ActionCursor(Mapping):
         return 1
 
     def __call__(self, *args, **kwargs) -> Any:
+        if self._compiled_action_arity == len(args):
+            return self._compiled_action(kwargs, *args)
+
         keyword_union_parameter = self._get_keyword_union_parameter()
 
         if len(self._actions) == 0:
@@ -177,7 +306,7 @@ class _ActionCursor(Mapping):
                 raise ActionCursorError("extra keyword arguments")
 
             return self._with_packing_of(args, by=tuple)._with(
-                internal_repr=(
+                internal_repr=lambda: (
                     f"({', '.join(map(self._repr_of, args))}"
                     f"{', ' if len(args) <= 1 else str()})"
                 ),
@@ -209,7 +338,7 @@ class _ActionCursor(Mapping):
     @_generation_transaction
     def _(self, *args: Special[Self], **kwargs: Special[Self]) -> Self:
         return self._with_calling_by(*args, **kwargs)._with(
-            internal_repr=f"{self._adapted_internal_repr}({{}})".format(
+            internal_repr=lambda: f"{self._adapted_internal_repr}({{}})".format(
                 ', '.join(map(self._repr_of, args))
                 + (', ' if args and kwargs else str())
                 + ', '.join(
@@ -235,6 +364,43 @@ class _ActionCursor(Mapping):
     def iobe(self, action: Special[Self | Callable]) -> Self:
         return self._be(action, mutably=True)
 
+    def over(self, **columns: Sequence) -> list | Any:
+        if (
+            self._positional_union_parameter is not None
+            or self._keyword_union_parameter is not None
+        ):
+            raise ActionCursorError("evaluation over columns with union parameters")
+
+        names = tuple(parameter.name for parameter in self._regular_parameters)
+
+        if frozenset(columns.keys()) != frozenset(names):
+            raise ActionCursorError("columns not matching parameters")
+
+        ordered_columns = tuple(columns[name] for name in names)
+
+        if len(frozenset(map(len, ordered_columns))) > 1:
+            raise ActionCursorError("columns of different lengths")
+
+        numpy = sys.modules.get("numpy")
+
+        if numpy is not None and ordered_columns and all(
+            isinstance(column, numpy.ndarray) for column in ordered_columns
+        ):
+            vectorized_action = self._get_compiled_column_action(is_vectorized=True)
+
+            if vectorized_action is not None:
+                return vectorized_action(dict(), *ordered_columns)
+
+        column_action = self._get_compiled_column_action()
+
+        if column_action is not None:
+            return column_action(ordered_columns)
+
+        return [
+            self._run(row, dict(), keyword_union_parameter=None)
+            for row in zip(*ordered_columns)
+        ]
+
     @_generation_transaction
     def _set(self, value: Special[Self], *, mutably: bool = False) -> Self:
         place, nature = self._nature
@@ -254,7 +420,7 @@ class _ActionCursor(Mapping):
         return (
             self
             ._with_setting(value, in_=place, by=setting, mutably=mutably)
-            ._with(internal_repr=("({} {} {})".format(
+            ._with(internal_repr=lambda: ("({} {} {})".format(
                 self._internal_repr,
                 '=' if mutably else '<-',
                 self._repr_of(value),
@@ -271,7 +437,9 @@ class _ActionCursor(Mapping):
             action = to(action)
 
         return partial(self._set, mutably=mutably)(partial(self._with, action)(
-            internal_repr=f"{code_like_repr_of(action)}({self._internal_repr})"
+            internal_repr=lambda: (
+                f"{code_like_repr_of(action)}({self._internal_repr})"
+            )
         ))
 
     def keys(self) -> tuple[str]:
@@ -281,11 +449,13 @@ class _ActionCursor(Mapping):
     def __getitem__(self, key: Special[Self | Tuple[Special[Self]]]) -> Self:
         if self._is_keyword_for_unpacking(key):
             return self._with(
-                internal_repr=f"**{self._single_adapted_internal_repr}"
+                internal_repr=lambda: f"**{self._single_adapted_internal_repr}"
             )
 
         keys = key if isinstance(key, tuple) else (key, )
-        formatted_keys = f"[{', '.join(map(self._repr_of, keys))}]"
+
+        def formatted_keys() -> str:
+            return f"[{', '.join(map(self._repr_of, keys))}]"
 
         if len(self._actions) == 0:
             packing_cursor = self._with_packing_of(keys, by=list)
@@ -309,8 +479,11 @@ class _ActionCursor(Mapping):
             )
             ._with_calling_by(*keys)
             ._with(
-                internal_repr=f"{self._adapted_internal_repr}{formatted_keys}",
+                internal_repr=lambda: (
+                    f"{self._adapted_internal_repr}{formatted_keys()}"
+                ),
                 nature=contextual(key, _ActionCursorNature.itemgetting),
+                node=self._item_getting_node_of(keys),
             )
         )
 
@@ -321,13 +494,19 @@ class _ActionCursor(Mapping):
         if len(self._actions) == 0:
             nature_value = _ActionCursorNature.vargetting
             is_generator_on_call = True
-            cursor = self._with(to(value_in(name, scope_in=2)), internal_repr=name)
+            value = value_in(name, scope_in=2)
+            cursor = self._with(
+                to(value),
+                internal_repr=name,
+                node=_ActionCursorValueNode(value),
+            )
         else:
             nature_value = _ActionCursorNature.attrgetting
             is_generator_on_call = self._is_generator_on_call
             cursor = self._with(
                 getattr |by| name,
-                internal_repr=f"{self._adapted_internal_repr}.{name}",
+                internal_repr=lambda: f"{self._adapted_internal_repr}.{name}",
+                node=self._application_node_of(getattr, self, name),
             )
 
         return cursor._with(
@@ -344,6 +523,7 @@ class _ActionCursor(Mapping):
             ]),
             nature=contextual(_ActionCursorNature.argument_entering),
             internal_repr=parameter.name,
+            node=_ActionCursorParameterNode(parameter.name),
         )
 
     @classmethod
@@ -351,8 +531,9 @@ class _ActionCursor(Mapping):
         return cls(
             actions=ActionChain([saving_context(to(value))]),
             nature=contextual(_ActionCursorNature.external_value_entering),
-            internal_repr=code_like_repr_of(value),
+            internal_repr=lambda: code_like_repr_of(value),
             is_call_generator_static=is_static,
+            node=_ActionCursorValueNode(value),
         )
 
     def _run(
@@ -361,8 +542,8 @@ class _ActionCursor(Mapping):
         kwargs: Mapping[str, Any],
         keyword_union_parameter: _ActionCursorParameter,
     ) -> Any:
-        parameters = tfilter(lambda p: p.union_type is None, self._parameters)
-        positional_union_parameter = self._get_positional_union_parameter()
+        parameters = self._regular_parameters
+        positional_union_parameter = self._positional_union_parameter
 
         if len(args) > len(parameters) and positional_union_parameter is None:
             raise ActionCursorError(
@@ -370,11 +551,12 @@ class _ActionCursor(Mapping):
             )
 
         elif len(args) < len(parameters):
-            return lambda *second_args, **second_kwargs: self._run(
-                args + second_args,
-                kwargs | second_kwargs,
-                keyword_union_parameter,
-            )
+            return _ActionCursorPartialApplication(self, args, kwargs)
+
+        compiled_action = self._get_compiled_action()
+
+        if compiled_action is not None:
+            return compiled_action(kwargs, *args)
 
         env = dict(zip(map(operator.attrgetter('name'), parameters), args))
 
@@ -396,6 +578,7 @@ class _ActionCursor(Mapping):
         internal_repr: Optional[str] = None,
         is_generator_on_call: bool = False,
         is_call_generator_static: Optional[bool] = None,
+        node: Optional[_ActionCursorNode] = None,
     ) -> None:
         is_call_generator_static = (
             self._is_call_generator_static
@@ -404,17 +587,22 @@ class _ActionCursor(Mapping):
         )
 
         return type(self)(
-            parameters=on(None, self._parameters)(parameters),
+            parameters=self._parameters if parameters is None else parameters,
             actions=(
                 action
                 if isinstance(action, ActionChain)
                 else ActionChain([action])
             ),
             previous=self._previous if previous is None else previous,
-            nature=on(None, self._nature)(nature),
-            internal_repr=on(None, self._internal_repr)(internal_repr),
+            nature=self._nature if nature is None else nature,
+            internal_repr=(
+                self._internal_repr_source
+                if internal_repr is None
+                else internal_repr
+            ),
             is_generator_on_call=is_generator_on_call or is_call_generator_static,
             is_call_generator_static=is_call_generator_static,
+            node=node,
         )
 
     def _with(
@@ -427,7 +615,15 @@ class _ActionCursor(Mapping):
         internal_repr: Optional[str] = None,
         is_generator_on_call: bool = False,
         is_call_generator_static: Optional[bool] = None,
+        node: Optional[_ActionCursorNode] = None,
     ) -> Self:
+        if node is None:
+            node = (
+                self._node
+                if action is None
+                else self._application_node_of(action, self)
+            )
+
         return self._of(
             self._actions |then>> (
                 ActionChain() if action is None else saving_context(action)
@@ -438,6 +634,7 @@ class _ActionCursor(Mapping):
             internal_repr=internal_repr,
             is_generator_on_call=is_generator_on_call,
             is_call_generator_static=is_call_generator_static,
+            node=node,
         )
 
     @_generation_transaction
@@ -461,9 +658,13 @@ class _ActionCursor(Mapping):
                     self._is_call_generator_static
                     or other._is_call_generator_static
                 ),
+                node=self._application_node_of(operation, self, other),
             )
             if isinstance(other, _ActionCursor)
-            else self._with(rpartial(operation, other))
+            else self._with(
+                rpartial(operation, other),
+                node=self._application_node_of(operation, self, other),
+            )
         )
 
         return cursor._with(nature=contextual(
@@ -578,12 +779,49 @@ class _ActionCursor(Mapping):
             and keyword.startswith(self._unpacking_key_template)
         )
 
+    @staticmethod
+    def _application_node_of(
+        action: Callable,
+        *operands: Special[Self],
+    ) -> Optional[_ActionCursorApplicationNode]:
+        operand_nodes = tuple(
+            (
+                operand._node
+                if isinstance(operand, _ActionCursor)
+                else _ActionCursorValueNode(operand)
+            )
+            for operand in operands
+            if not isinstance(operand, _ActionCursorUnpacking)
+        )
+
+        if len(operand_nodes) != len(operands) or None in operand_nodes:
+            return None
+
+        return _ActionCursorApplicationNode(action, operand_nodes)
+
+    def _item_getting_node_of(
+        self,
+        keys: Tuple[Special[Self]],
+    ) -> Optional[_ActionCursorApplicationNode]:
+        if len(keys) == 1:
+            return self._application_node_of(operator.getitem, self, keys[0])
+
+        key_node = self._application_node_of(tuple_of, *keys)
+
+        if self._node is None or key_node is None:
+            return None
+
+        return _ActionCursorApplicationNode(operator.getitem, (self._node, key_node))
+
     def _getting_name_by(self, name: str) -> str:
-        for attribute_name in dir(self):
-            if (
-                name.startswith(attribute_name)
-                and all(map(operator.eq |by| '_', name[len(attribute_name) + 1:]))
-            ):
+        reserved_names = self._reserved_names_by_type.get(type(self))
+
+        if reserved_names is None:
+            reserved_names = frozenset(dir(self))
+            self._reserved_names_by_type[type(self)] = reserved_names
+
+        for reserved_name_end in range(len(name.rstrip('_')), len(name)):
+            if name[:reserved_name_end] in reserved_names:
                 return name[:-1]
 
         return name
@@ -654,10 +892,21 @@ class _ActionCursor(Mapping):
             if len(cursor._actions) == 0:
                 raise ActionCursorError("interaction with external cursor")
 
-            internal_repr = cursor._internal_repr_by(
-                model,
-                on_left_side=not is_right
-            )
+            def internal_repr() -> str:
+                cursor_repr = cursor._internal_repr_by(
+                    model,
+                    on_left_side=not is_right
+                )
+
+                return (
+                    f"{cursor_repr} {model.sign} {{}}"
+                    if not is_right
+                    else f"{{}} {model.sign} {cursor_repr}"
+                ).format(
+                    value._internal_repr_by(model, on_left_side=is_right)
+                    if isinstance(value, _ActionCursor)
+                    else _ActionCursor._repr_of(value)
+                )
 
             return (
                 cursor
@@ -666,18 +915,15 @@ class _ActionCursor(Mapping):
                     by=flipped(operation) if is_right else operation,
                 )
                 ._with(
-                    nature=contextual(model, _ActionCursorNature.binary_operation),
-                    internal_repr=(
-                        (
-                            f"{internal_repr} {model.sign} {{}}"
-                            if not is_right
-                            else f"{{}} {model.sign} {internal_repr}"
-                        ).format(
-                            value._internal_repr_by(model, on_left_side=is_right)
-                            if isinstance(value, _ActionCursor)
-                            else _ActionCursor._repr_of(value)
+                    node=(
+                        _ActionCursor._application_node_of(operation, value, cursor)
+                        if is_right
+                        else _ActionCursor._application_node_of(
+                            operation, cursor, value
                         )
-                    )
+                    ),
+                    nature=contextual(model, _ActionCursorNature.binary_operation),
+                    internal_repr=internal_repr,
                 )
             )
 
@@ -692,7 +938,9 @@ class _ActionCursor(Mapping):
             return cursor._with(
                 operation,
                 nature=contextual(model, _ActionCursorNature.single_operation),
-                internal_repr=f"{model.sign}{cursor._internal_repr_by(model)}",
+                internal_repr=lambda: (
+                    f"{model.sign}{cursor._internal_repr_by(model)}"
+                ),
             )
 
         return cursor_transformer
@@ -796,93 +1044,863 @@ class _ActionCursor(Mapping):
     )
 
 
-def _dynamic(cursor: _ActionCursor) -> Self:
-    return cursor._with(is_call_generator_static=False)
+_binary_operator_by_action: Tuple[Tuple[Callable, type[ast.operator]], ...] = (
+    (operator.add, ast.Add),
+    (operator.sub, ast.Sub),
+    (operator.mul, ast.Mult),
+    (operator.truediv, ast.Div),
+    (operator.floordiv, ast.FloorDiv),
+    (operator.mod, ast.Mod),
+    (operator.pow, ast.Pow),
+    (operator.matmul, ast.MatMult),
+    (operator.lshift, ast.LShift),
+    (operator.rshift, ast.RShift),
+    (operator.and_, ast.BitAnd),
+    (operator.or_, ast.BitOr),
+    (operator.xor, ast.BitXor),
+)
 
+_comparison_operator_by_action: Tuple[Tuple[Callable, type[ast.cmpop]], ...] = (
+    (operator.eq, ast.Eq),
+    (operator.ne, ast.NotEq),
+    (operator.lt, ast.Lt),
+    (operator.le, ast.LtE),
+    (operator.gt, ast.Gt),
+    (operator.ge, ast.GtE),
+    (operator.is_, ast.Is),
+    (operator.is_not, ast.IsNot),
+)
 
-def _static(cursor: _ActionCursor) -> Self:
-    return cursor._with(is_call_generator_static=True)
+_unary_operator_by_action: Tuple[Tuple[Callable, type[ast.unaryop]], ...] = (
+    (operator.pos, ast.UAdd),
+    (operator.neg, ast.USub),
+    (operator.invert, ast.Invert),
+    (operator.not_, ast.Not),
+)
 
 
-def _normilized(numbers: Iterable[int]) -> list[int]:
-    normilized_numbers = list()
+def _native_operator_of(
+    action: Callable,
+    operator_by_action: Tuple[Tuple[Callable, type[ast.AST]], ...],
+) -> Optional[ast.AST]:
+    for operator_action, native_operator in operator_by_action:
+        if operator_action is action:
+            return native_operator()
 
-    for current_number in numbers:
-        smaller_number_counter = 0
+    return None
 
-        for target_number in numbers:
-            if current_number > target_number:
-                smaller_number_counter += 1
 
-        normilized_numbers.append(smaller_number_counter)
+_pure_actions: Tuple[Callable, ...] = (
+    *(action for action, _ in _binary_operator_by_action),
+    *(action for action, _ in _comparison_operator_by_action),
+    *(action for action, _ in _unary_operator_by_action),
+    operator.contains,
+    operator.getitem,
+    getattr,
+    partial,
+    tuple_of,
+)
 
-    return normilized_numbers
+_value_key_types: Tuple[type, ...] = (int, str, bytes, bool, type(None))
 
 
-def _fn(*cursors: _ActionCursor) -> Callable[_ActionCursor, Callable]:
-    if len(cursors) == 0:
-        return fun
+def _is_pure(action: Callable) -> bool:
+    return _is_one_of(action, _pure_actions)
+
+
+def _is_one_of(action: Callable, actions: Tuple[Callable, ...]) -> bool:
+    return any(action is other_action for other_action in actions)
+
+
+_foldable_types: Tuple[type, ...] = (
+    int, float, complex, str, bytes, bool, type(None)
+)
+
+_bool_actions: Tuple[Callable, ...] = (
+    operator.not_,
+    operator.truth,
+    operator.contains,
+    operator.is_,
+    operator.is_not,
+    bool,
+    callable,
+    isinstance,
+    hasattr,
+)
+
+_int_actions: Tuple[Callable, ...] = (len, ord)
+
+_bitwise_actions: Tuple[Callable, ...] = (
+    operator.and_, operator.or_, operator.xor
+)
+
+_int_preserving_actions: Tuple[Callable, ...] = (
+    *_bitwise_actions,
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.floordiv,
+    operator.mod,
+    operator.lshift,
+    operator.rshift,
+    operator.pos,
+    operator.neg,
+    operator.invert,
+)
+
+_neutral_operands_by_action: Tuple[Tuple[Callable, int, bool], ...] = (
+    (operator.add, 0, True),
+    (operator.sub, 0, False),
+    (operator.mul, 1, True),
+    (operator.floordiv, 1, False),
+)
+
+_involutory_actions: Tuple[Tuple[Callable, type], ...] = (
+    (operator.neg, int),
+    (operator.invert, int),
+    (operator.not_, bool),
+)
+
+
+def _is_foldable(value: Any) -> bool:
+    return type(value) in _foldable_types or (
+        type(value) is tuple and all(map(_is_foldable, value))
+    )
+
+
+def _is_int_of(value: int, node: _ActionCursorNode) -> bool:
+    return (
+        isinstance(node, _ActionCursorValueNode)
+        and type(node.value) is int
+        and node.value == value
+    )
+
+
+class _ActionCursorSimplification:
+    """
+    Simplification of a cursor node without changing its results.
+
+    Pure applications of constants of immutable types are folded, calls of
+    partially applied constant actions become applications of these actions
+    and identity operations are removed where types of their operands are
+    known to keep results the same.
+    """
+
+    def __init__(self) -> None:
+        self._simplified_by_node_id = dict()
+        self._known_type_by_node_id = dict()
+
+    def simplified(self, node: _ActionCursorNode) -> _ActionCursorNode:
+        if not isinstance(node, _ActionCursorApplicationNode):
+            return node
+
+        elif id(node) in self._simplified_by_node_id:
+            return self._simplified_by_node_id[id(node)]
+
+        operands = tuple(map(self.simplified, node.operands))
+
+        simplified_node = self._simplified_application(
+            _ActionCursorApplicationNode(node.action, operands)
+            if any(map(operator.is_not, operands, node.operands))
+            else node
+        )
+        self._simplified_by_node_id[id(node)] = simplified_node
+
+        return simplified_node
+
+    def _simplified_application(
+        self,
+        node: _ActionCursorApplicationNode,
+    ) -> _ActionCursorNode:
+        if node.action is operator.call and len(node.operands) == 1:
+            argument_nodes = list()
+            function_node = node.operands[0]
+
+            while (
+                isinstance(function_node, _ActionCursorApplicationNode)
+                and function_node.action is partial
+                and len(function_node.operands) == 2
+            ):
+                function_node, argument_node = function_node.operands
+                argument_nodes.append(argument_node)
+
+            if argument_nodes and isinstance(function_node, _ActionCursorValueNode):
+                return self._simplified_application(_ActionCursorApplicationNode(
+                    function_node.value,
+                    tuple(reversed(argument_nodes)),
+                ))
+
+        if _is_pure(node.action) and all(
+            isinstance(operand, _ActionCursorValueNode)
+            and _is_foldable(operand.value)
+            for operand in node.operands
+        ):
+            try:
+                value = node.action(*(operand.value for operand in node.operands))
+            except Exception:
+                return node
+
+            return _ActionCursorValueNode(value) if _is_foldable(value) else node
+
+        elif len(node.operands) == 2:
+            left, right = node.operands
+
+            for action, neutral_value, is_commutative in _neutral_operands_by_action:
+                if node.action is not action:
+                    continue
+
+                elif (
+                    _is_int_of(neutral_value, right)
+                    and self._known_type_of(left) is int
+                ):
+                    return left
+
+                elif (
+                    is_commutative
+                    and _is_int_of(neutral_value, left)
+                    and self._known_type_of(right) is int
+                ):
+                    return right
+
+        elif len(node.operands) == 1:
+            operand = node.operands[0]
+
+            if node.action is operator.pos and self._known_type_of(operand) is int:
+                return operand
+
+            for action, type_ in _involutory_actions:
+                if (
+                    node.action is action
+                    and isinstance(operand, _ActionCursorApplicationNode)
+                    and operand.action is action
+                    and self._known_type_of(operand.operands[0]) is type_
+                ):
+                    return operand.operands[0]
+
+        return node
+
+    def _known_type_of(self, node: _ActionCursorNode) -> Optional[type]:
+        if isinstance(node, _ActionCursorParameterNode):
+            return None
+
+        elif isinstance(node, _ActionCursorValueNode):
+            return type(node.value)
+
+        elif id(node) in self._known_type_by_node_id:
+            return self._known_type_by_node_id[id(node)]
+
+        known_type = None
 
-    parameter_cursors = list()
-    void_parameter_indexes = list()
+        if _is_one_of(node.action, _bool_actions):
+            known_type = bool
 
-    for index, cursor in enumerate(parameter_cursors):
-        if cursor in [_, act]:  # noqa: F821
-            void_parameter_indexes.append(index)
+        elif _is_one_of(node.action, _int_actions):
+            known_type = int
+
+        elif _is_one_of(node.action, _int_preserving_actions):
+            operand_types = set(map(self._known_type_of, node.operands))
+
+            if (
+                operand_types == {bool}
+                and _is_one_of(node.action, _bitwise_actions)
+            ):
+                known_type = bool
+
+            elif operand_types <= {int, bool}:
+                known_type = int
+
+        self._known_type_by_node_id[id(node)] = known_type
+
+        return known_type
+
+
+class _ActionCursorCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _ActionCursorCache:
+    """
+    Bounded cache of compiled cursor actions by structural keys of cursor
+    nodes, so structurally identical cursors share one compiled action.
+
+    Constants of immutable types are keyed by their values and other
+    constants and actions by their identities, so the cache keeps them alive
+    while their entries are cached. Compilation itself runs outside of the
+    lock, so concurrent misses of one key may compile it more than once.
+    """
+
+    def __init__(self, *, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def info(self) -> _ActionCursorCacheInfo:
+        with self._lock:
+            return _ActionCursorCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._entries.clear()
+
+    def compiled_action_of(
+        self,
+        compiled_action_of: Callable[..., Optional[Callable]],
+        node: _ActionCursorNode,
+        parameters: Iterable[_ActionCursorParameter],
+        **kwargs: Any,
+    ) -> Optional[Callable]:
+        parameters = tuple(parameters)
+
+        try:
+            key, kept_values = self._key_of(node)
+        except RecursionError:
+            return compiled_action_of(node, parameters, **kwargs)
+
+        key = (compiled_action_of, tuple(kwargs.items()), parameters, key)
+
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+                return self._entries[key][0]
+
+            self._misses += 1
+
+        compiled_action = compiled_action_of(node, parameters, **kwargs)
+
+        with self._lock:
+            self._entries[key] = (compiled_action, kept_values)
+
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return compiled_action
+
+    @staticmethod
+    def _key_of(node: _ActionCursorNode) -> tuple[tuple, list]:
+        index_by_structure = dict()
+        index_by_node_id = dict()
+        kept_values = list()
+
+        def index_of(node: _ActionCursorNode) -> int:
+            if id(node) in index_by_node_id:
+                return index_by_node_id[id(node)]
+
+            if isinstance(node, _ActionCursorParameterNode):
+                structure = ("parameter", node.name)
+
+            elif isinstance(node, _ActionCursorValueNode):
+                if type(node.value) in _value_key_types:
+                    structure = ("value", type(node.value), node.value)
+                else:
+                    structure = ("value", id(node.value))
+                    kept_values.append(node.value)
+
+            else:
+                structure = (
+                    "application",
+                    id(node.action),
+                    *map(index_of, node.operands),
+                )
+                kept_values.append(node.action)
+
+            index = index_by_structure.setdefault(
+                structure, len(index_by_structure)
+            )
+            index_by_node_id[id(node)] = index
+
+            return index
+
+        index_of(node)
+
+        return tuple(index_by_structure), kept_values
+
+
+_compiled_action_cache = _ActionCursorCache(maxsize=1024)
+
+
+def _cached_by_structure(
+    compiled_action_of: Callable[..., Optional[Callable]],
+) -> Callable[..., Optional[Callable]]:
+    @wraps(compiled_action_of)
+    def cached_compiled_action_of(
+        node: _ActionCursorNode,
+        parameters: Iterable[_ActionCursorParameter],
+        **kwargs: Any,
+    ) -> Optional[Callable]:
+        return _compiled_action_cache.compiled_action_of(
+            compiled_action_of, node, parameters, **kwargs
+        )
+
+    return cached_compiled_action_of
+
+
+@_cached_by_structure
+def _compiled_action_of(
+    node: _ActionCursorNode,
+    parameters: Iterable[_ActionCursorParameter],
+    *,
+    is_vectorized: bool = False,
+) -> Optional[Callable]:
+    """
+    Function to lower a cursor node into a plain function taking keyword
+    arguments as a dictionary first, then regular parameters and then a
+    positional union parameter, or `None` if the node cannot be lowered.
+
+    Vectorized lowering takes whole NumPy columns as regular parameters and
+    is possible only for nodes of arithmetic, comparisons and item getting.
+    """
+
+    try:
+        if is_vectorized and not _is_vectorizable(node):
+            return None
+    except RecursionError:
+        return None
+
+    positional_union_names = list()
+    keyword_union_names = ["__keywords"]
+    regular_names = list()
+
+    for parameter in parameters:
+        if parameter.union_type is _ActionCursorParameterUnionType.POSITIONAL:
+            positional_union_names.append(f"*{parameter.name}")
+        elif parameter.union_type is _ActionCursorParameterUnionType.KEYWORD:
+            keyword_union_names = [parameter.name]
         else:
-            parameter_cursors.append(cursor)
+            regular_names.append(parameter.name)
 
-    if len(frozenset(map(id, parameter_cursors))) != len(parameter_cursors):
-        return ActionCursorError("repeating parameters")
+    signature = ', '.join(
+        keyword_union_names + regular_names + positional_union_names
+    )
+
+    return _function_of(
+        node,
+        (
+            f"def action_cursor({signature}):\n"
+            "    pass\n"
+            "    return __result\n"
+        ),
+        _ActionCursorLowering(is_vectorized=is_vectorized),
+    )
+
+
+@_cached_by_structure
+def _compiled_column_action_of(
+    node: _ActionCursorNode,
+    parameters: Iterable[_ActionCursorParameter],
+) -> Optional[Callable]:
+    """
+    Function to lower a cursor node into a plain function evaluating it row by
+    row over a tuple of columns of regular parameters into a `list`, or `None`
+    if the node cannot be lowered.
+    """
+
+    names = ''.join(f"{parameter.name}, " for parameter in parameters)
+
+    return _function_of(
+        node,
+        (
+            "def action_cursor(__columns):\n"
+            "    __results = list()\n"
+            "    __append = __results.append\n"
+            f"    for {names}in zip(*__columns):\n"
+            "        pass\n"
+            "        __append(__result)\n"
+            "    return __results\n"
+        ),
+        _ActionCursorLowering(),
+    )
+
+
+def _function_of(
+    node: _ActionCursorNode,
+    source: str,
+    lowering: "_ActionCursorLowering",
+) -> Optional[Callable]:
+    """
+    Function to compile an `action_cursor` function from a source in which
+    `pass` is replaced by the simplified and lowered node assigned to
+    `__result`.
+    """
+
+    try:
+        node = _ActionCursorSimplification().simplified(node)
+        result = lowering.name_of(node)
+        module = ast.parse(source)
+
+        for parent in ast.walk(module):
+            body = getattr(parent, "body", None)
+
+            if isinstance(body, list) and isinstance(body[0], ast.Pass):
+                body[0:1] = [
+                    *lowering.statements,
+                    ast.Assign([ast.Name("__result", ast.Store())], result),
+                ]
+                break
+
+        ast.fix_missing_locations(module)
+
+        exec(compile(module, "<action cursor>", "exec"), lowering.namespace)
+    except (RecursionError, SyntaxError, ValueError):
+        return None
+
+    return lowering.namespace["action_cursor"]
+
+
+_vectorizable_actions: Tuple[Callable, ...] = (
+    *(
+        action
+        for action, _ in _binary_operator_by_action
+        if action is not operator.matmul
+    ),
+    *(
+        action
+        for action, _ in _comparison_operator_by_action
+        if action is not operator.is_ and action is not operator.is_not
+    ),
+    operator.pos,
+    operator.neg,
+    operator.invert,
+)
+
+
+def _is_vectorizable(node: _ActionCursorNode) -> bool:
+    if isinstance(node, _ActionCursorParameterNode):
+        return True
 
-    has_kwargs = kwargs is parameter_cursors[-1]  # noqa: F821
-    has_args: bool
+    elif isinstance(node, _ActionCursorValueNode):
+        return isinstance(node.value, int | float | complex)
 
-    if has_kwargs:
-        has_args = (
-            False
-            if len(parameter_cursors) == 1
-            else args is parameter_cursors[-2]  # noqa: F821
+    elif node.action is operator.getitem:
+        container, key = node.operands
+
+        return (
+            isinstance(key, _ActionCursorValueNode)
+            and type(key.value) is int
+            and _has_parameters(container)
+            and _is_vectorizable(container)
         )
-    else:
-        has_args = args is parameter_cursors[-1]  # noqa: F821
 
-    required_parameters_length = (
-        len(parameter_cursors) - int(has_args) - int(has_kwargs)
+    return (
+        any(node.action is action for action in _vectorizable_actions)
+        and all(map(_is_vectorizable, node.operands))
     )
-    required_parameter_cursors = parameter_cursors[:required_parameters_length]
 
-    for cursor in required_parameter_cursors:
-        if cursor._natrue.value != _ActionCursorNature.atomic:
+
+def _has_parameters(node: _ActionCursorNode) -> bool:
+    if isinstance(node, _ActionCursorParameterNode):
+        return True
+
+    elif isinstance(node, _ActionCursorValueNode):
+        return False
+
+    return any(map(_has_parameters, node.operands))
+
+
+class _ActionCursorLowering:
+    """
+    Lowering of a cursor node into assignments in the order of its evaluation.
+
+    Nodes of pure actions are hash-consed by their structure, so each distinct
+    pure subexpression is evaluated once. Any other node is a barrier after
+    which values evaluated before it are not reused.
+    """
+
+    def __init__(self, *, is_vectorized: bool = False) -> None:
+        self.is_vectorized = is_vectorized
+        self.namespace = dict()
+        self.statements = list()
+        self._name_by_key = dict()
+        self._key_by_structure = dict()
+        self._key_by_node_id = dict()
+
+    def name_of(self, node: _ActionCursorNode) -> ast.expr:
+        if isinstance(node, _ActionCursorParameterNode):
+            return ast.Name(node.name, ast.Load())
+
+        elif isinstance(node, _ActionCursorValueNode):
+            return self._value_name_of(node.value)
+
+        key = self._key_of(node)
+
+        if key is not None and key in self._name_by_key:
+            return ast.Name(self._name_by_key[key], ast.Load())
+
+        expression = self._expression_of(node)
+        name = f"__node_{len(self.statements)}"
+        self.statements.append(
+            ast.Assign([ast.Name(name, ast.Store())], expression)
+        )
+
+        if key is not None:
+            self._name_by_key[key] = name
+        elif not _is_pure(node.action):
+            self._name_by_key.clear()
+
+        return ast.Name(name, ast.Load())
+
+    def _key_of(self, node: _ActionCursorNode) -> Optional[int]:
+        if id(node) in self._key_by_node_id:
+            return self._key_by_node_id[id(node)]
+
+        if isinstance(node, _ActionCursorParameterNode):
+            structure = ("parameter", node.name)
+
+        elif isinstance(node, _ActionCursorValueNode):
+            structure = (
+                ("value", type(node.value), node.value)
+                if type(node.value) in _value_key_types
+                else ("value", id(node.value))
+            )
+
+        elif _is_pure(node.action):
+            operand_keys = tuple(map(self._key_of, node.operands))
+            structure = (
+                None
+                if None in operand_keys
+                else ("application", id(node.action), *operand_keys)
+            )
+
+        else:
+            structure = None
+
+        key = (
+            None
+            if structure is None
+            else self._key_by_structure.setdefault(
+                structure,
+                len(self._key_by_structure),
+            )
+        )
+        self._key_by_node_id[id(node)] = key
+
+        return key
+
+    def _expression_of(self, node: _ActionCursorApplicationNode) -> ast.expr:
+        if node.action is operator.call and len(node.operands) == 1:
+            return self._call_expression_of(node.operands[0])
+
+        operands = tuple(map(self.name_of, node.operands))
+
+        if len(operands) == 1:
+            unary_operator = _native_operator_of(
+                node.action, _unary_operator_by_action
+            )
+
+            if unary_operator is not None:
+                return ast.UnaryOp(unary_operator, operands[0])
+
+        elif len(operands) == 2:
+            binary_operator = _native_operator_of(
+                node.action, _binary_operator_by_action
+            )
+
+            if binary_operator is not None:
+                return ast.BinOp(operands[0], binary_operator, operands[1])
+
+            comparison_operator = _native_operator_of(
+                node.action, _comparison_operator_by_action
+            )
+
+            if comparison_operator is not None:
+                return ast.Compare(
+                    operands[0], [comparison_operator], [operands[1]]
+                )
+
+            elif node.action is operator.contains:
+                return ast.Compare(operands[1], [ast.In()], [operands[0]])
+
+            elif node.action is operator.getitem and self.is_vectorized:
+                return ast.Subscript(
+                    operands[0],
+                    ast.Tuple([ast.Slice(), operands[1]], ast.Load()),
+                    ast.Load(),
+                )
+
+            elif node.action is operator.getitem:
+                return ast.Subscript(operands[0], operands[1], ast.Load())
+
+            elif (
+                node.action is getattr
+                and isinstance(node.operands[1], _ActionCursorValueNode)
+                and isinstance(node.operands[1].value, str)
+                and node.operands[1].value.isidentifier()
+                and not iskeyword(node.operands[1].value)
+            ):
+                return ast.Attribute(
+                    operands[0], node.operands[1].value, ast.Load()
+                )
+
+        return ast.Call(self._value_name_of(node.action), list(operands), list())
+
+    def _call_expression_of(self, node: _ActionCursorNode) -> ast.Call:
+        argument_nodes = list()
+
+        while (
+            isinstance(node, _ActionCursorApplicationNode)
+            and node.action is partial
+            and len(node.operands) == 2
+        ):
+            node, argument_node = node.operands
+            argument_nodes.append(argument_node)
+
+        function = self.name_of(node)
+        arguments = [
+            self.name_of(argument_node)
+            for argument_node in reversed(argument_nodes)
+        ]
+
+        return ast.Call(function, arguments, list())
+
+    def _value_name_of(self, value: Any) -> ast.Name:
+        name = f"__value_{len(self.namespace)}"
+        self.namespace[name] = value
+
+        return ast.Name(name, ast.Load())
+
+
+def _dynamic(cursor: _ActionCursor) -> Self:
+    return cursor._with(is_call_generator_static=False)
+
+
+def _static(cursor: _ActionCursor) -> Self:
+    return cursor._with(is_call_generator_static=True)
+
+
+def _fn(*cursors: _ActionCursor) -> Callable[_ActionCursor, Callable]:
+    if len(cursors) == 0:
+        return fun
+
+    positional_names = list()
+    parameters = list()
+    positional_union_parameter = None
+    keyword_union_parameter = None
+
+    for index, cursor in enumerate(cursors):
+        if (
+            not isinstance(cursor, _ActionCursor)
+            or cursor._nature.value != _ActionCursorNature.atomic
+        ):
             raise ActionCursorError("calculation parameters")
-        if cursor is args:  # noqa: F821
-            raise ActionCursorError("parameters after `args`")
-        if cursor is kwargs:  # noqa: F821
+
+        if keyword_union_parameter is not None:
             raise ActionCursorError("`kwargs` not at the end of parameters")
 
-    required_parameters = tmap(
-        lambda c: c._parameters[0],
-        required_parameter_cursors,
-    )
+        parameter = (
+            None
+            if cursor._nature.value == _ActionCursorNature.external
+            else cursor._parameters[0]
+        )
 
-    argument_order = _normilized(  # noqa: F841
-        tmap(lambda p: p.priority, required_parameters)
-    )
+        if parameter in parameters:
+            raise ActionCursorError("repeating parameters")
+
+        elif parameter is None or parameter.union_type is None:
+            if positional_union_parameter is not None:
+                raise ActionCursorError("parameters after `args`")
+
+            positional_names.append(
+                f"_{index}" if parameter is None else parameter.name
+            )
+
+        elif parameter.union_type is _ActionCursorParameterUnionType.POSITIONAL:
+            positional_union_parameter = parameter
+
+        else:
+            keyword_union_parameter = parameter
+
+        if parameter is not None:
+            parameters.append(parameter)
+
+    signature = ', '.join((
+        *positional_names,
+        *(('/', ) if positional_names else tuple()),
+        *(
+            tuple()
+            if positional_union_parameter is None
+            else (f"*{positional_union_parameter.name}", )
+        ),
+        *(
+            tuple()
+            if keyword_union_parameter is None
+            else (f"**{keyword_union_parameter.name}", )
+        ),
+    ))
 
     def decorator(main: _ActionCursor) -> Callable:
-        if _is_parameters_non_matching(required_parameters, main._parameters):
+        if not isinstance(main, _ActionCursor):
+            raise ActionCursorError("function body without cursors")
+
+        if not frozenset(main._parameters) <= frozenset(parameters):
             raise ActionCursorError("non-matching parameters to arguments")
 
-        def func(*args, **kwargs):
-            if not has_kwargs and kwargs:
-                raise ActionCursorError("keyword arguments")
+        action = (
+            None
+            if main._node is None
+            else _function_of(
+                main._node,
+                (
+                    f"def action_cursor({signature}):\n"
+                    "    pass\n"
+                    "    return __result\n"
+                ),
+                _ActionCursorLowering(),
+            )
+        )
+
+        if action is None:
+            action = _interpreting_function_of(main, signature)
 
+        return action
 
-def _is_parameters_non_matching(
-    first_parameters: tuple[_ActionCursorParameter],
-    second_parameters: tuple[_ActionCursorParameter],
-) -> bool:
-    return (
-        len(first_parameters) == len(second_parameters)
-        and frozenset(first_parameters) == frozenset(second_parameters)
+    return decorator
+
+
+def _interpreting_function_of(cursor: _ActionCursor, signature: str) -> Callable:
+    """
+    Function to create a function with an input signature that runs an input
+    cursor through its `_run`.
+    """
+
+    positional_arguments = ''.join((
+        *(f"{parameter.name}, " for parameter in cursor._regular_parameters),
+        *(
+            tuple()
+            if cursor._positional_union_parameter is None
+            else (f"*{cursor._positional_union_parameter.name}, ", )
+        ),
+    ))
+    keyword_arguments = (
+        "dict()"
+        if cursor._keyword_union_parameter is None
+        else cursor._keyword_union_parameter.name
+    )
+
+    namespace = dict(
+        __cursor=cursor,
+        __keyword_union_parameter=cursor._keyword_union_parameter,
     )
+
+    exec(
+        (
+            f"def action_cursor({signature}):\n"
+            f"    return __cursor._run(\n"
+            f"        ({positional_arguments}),\n"
+            f"        {keyword_arguments},\n"
+            "        __keyword_union_parameter,\n"
+            "    )\n"
+        ),
+        namespace,
+    )
+
+    return namespace["action_cursor"]
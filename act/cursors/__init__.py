@@ -0,0 +1,8 @@
+from act.cursor_base import _compiled_action_cache
+
+
+__all__ = ("cache_info", "cache_clear")
+
+
+cache_info = _compiled_action_cache.info
+cache_clear = _compiled_action_cache.clear
@@ -1,12 +1,13 @@
 from act.contexting import contextual
 from act.cursor_base import (
     _ActionCursor, _ActionCursorNature, _ActionCursorParameter,
-    _ActionCursorParameterUnionType
+    _ActionCursorParameterUnionType, _fn
 )
 from act.partiality import partial
 
 
 __all__ = (
+    "fn",
     "same",
     "act",
     '_',
@@ -41,6 +42,7 @@ __all__ = (
 )
 
 
+fn = _fn
 same = partial(_ActionCursor._lift, is_static=False)
 
 
@@ -4,6 +4,7 @@ from act.partiality import partial
 
 
 __all__ = (
+    "fn",
     "same",
     "act",
     '_',
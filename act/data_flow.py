@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from operator import not_
+from threading import RLock
 from typing import (
     Callable, Any, Optional, Tuple, Self, Iterable, NamedTuple, Generic
 )
@@ -177,9 +178,11 @@ class double(Decorator):
 class once:
     _result: Optional[R] = None
     _was_called: bool = False
+    _is_done: bool = False
 
     def __init__(self, action: Callable[Pm, R]):
         self._action = action
+        self._lock = RLock()
 
     def __repr__(self) -> str:
         return f"once({{}}{code_like_repr_of(self._action)})".format(
@@ -189,11 +192,19 @@ class once:
         )
 
     def __call__(self, *args: Pm.args, **kwargs: Pm.kwargs) -> R:
-        if self._was_called:
+        if self._is_done:
             return self._result
 
-        self._was_called = True
-        self._result = self._action(*args, **kwargs)
+        with self._lock:
+            if self._was_called:
+                return self._result
+
+            self._was_called = True
+
+            try:
+                self._result = self._action(*args, **kwargs)
+            finally:
+                self._is_done = True
 
         return self._result
 
@@ -1,14 +1,20 @@
+import builtins
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from copy import copy, deepcopy
 from dataclasses import dataclass, MISSING
 from functools import reduce
-from operator import or_, attrgetter, methodcaller
-from types import MethodType
+from inspect import getattr_static
+from operator import attrgetter
+from types import (
+    MappingProxyType, MethodType, FunctionType, BuiltinFunctionType,
+    WrapperDescriptorType, MethodDescriptorType
+)
 from typing import (
     Mapping, Callable, Self, Generic, Concatenate, Any, Optional, Tuple, ClassVar,
-    Iterable
+    Iterable, Final, TypeAlias, NoReturn
 )
+from weakref import WeakKeyDictionary
 
 from pyannotating import Special
 
@@ -18,10 +24,10 @@ from act.annotations import (
 )
 from act.atomization import fun
 from act.contexting import (
-    contextually, contexted, contextualizing, be, of
+    ContextualForm, contextually, contexted, contextualizing, be
 )
 from act.data_flow import (
-    mergely, by, io, when, always, and_via_indexer, indexer_of, via_indexer
+    mergely, by, io, when, and_via_indexer, indexer_of, via_indexer
 )
 from act.errors import ObjectTemplateError
 from act.error_flow import raising
@@ -37,6 +43,7 @@ from act.tools import documenting_by, _get
 
 __all__ = (
     "dict_of",
+    "dict_of_view",
     "as_method",
     "as_descriptor",
     "as_property",
@@ -44,6 +51,7 @@ __all__ = (
     "with_default_descriptor",
     "default_descriptor",
     "val",
+    "frozenval",
     "type",
     "type_",
     "constructor",
@@ -56,6 +64,7 @@ __all__ = (
     "expand",
     "from_",
     "like",
+    "mismatch_path_of",
     "to_attr",
     "read_only",
     "sculpture_of",
@@ -81,6 +90,26 @@ def dict_of(value: Special[Mapping[K, V]]) -> dict[K, V]:
         return dict()
 
 
+_EMPTY_VIEW: Final[Mapping] = MappingProxyType(dict())
+
+
+def dict_of_view(value: Special[Mapping[K, V]]) -> Mapping[K, V]:
+    """
+    Function to read from `__dict__` attribute without copying.
+
+    Returns a read-only view of `__dict__` or of an input `Mapping` object
+    reflecting their changes, or an empty `Mapping` when an input value has no
+    a `__dict__` attribute.
+    """
+
+    if hasattr(value, "__dict__"):
+        return MappingProxyType(value.__dict__)
+    elif isinstance(value, dict) or isinstance(value, Mapping):
+        return MappingProxyType(value)
+    else:
+        return _EMPTY_VIEW
+
+
 as_method = contextualizing(flag_about("as_method"), to=contextually)
 as_descriptor = contextualizing(flag_about("as_descriptor"))
 
@@ -174,13 +203,14 @@ class _AttributeKeeper(Arbitrary, ABC):
     )
 
     def __init__(self, *objects, **attributes):
-        attributes = type(self)._attributes_from(objects) | attributes
+        type_ = type(self)
+        attributes = type_._attributes_from(objects, attributes)
 
-        self.__dict__ = {
-            name: type(self)._for_setting(attr)
+        type_._set_attributes(self, {
+            name: type_._for_setting(attr)
             for name, attr in attributes.items()
-            if name not in type(self)._ignored_attribute_names
-        }
+            if name not in type_._ignored_attribute_names
+        })
 
     @abstractmethod
     def __instancecheck__(self, instance: Any) -> bool:
@@ -196,10 +226,10 @@ class _AttributeKeeper(Arbitrary, ABC):
         return hash(type(self)) + id(self)
 
     def __copy__(self) -> Self:
-        return type(self)(**dict_of(self))
+        return type(self)(**dict_of_view(self))
 
     def __eq__(self, other: Special[Self]) -> bool:
-        return dict_of(self) == dict_of(other)
+        return dict_of_view(self) == dict_of_view(other)
 
     @to_clone
     def __add__(self, attr_name: str) -> Self:
@@ -244,13 +274,21 @@ class _AttributeKeeper(Arbitrary, ABC):
             return f"{name}={code_like_repr_of(value)}"
 
     @staticmethod
-    def _attributes_from(objects: Tuple[Special[dict]]) -> dict:
-        if len(objects) == 0:
-            return dict()
-        elif len(objects) == 1:
-            return dict_of(objects[0])
-        else:
-            return reduce(or_, map(dict_of, objects))
+    def _attributes_from(
+        objects: Tuple[Special[Mapping]],
+        attributes: Mapping[str, Any],
+    ) -> dict:
+        merged_attributes = dict()
+
+        for object_ in objects:
+            merged_attributes.update(dict_of_view(object_))
+
+        merged_attributes.update(attributes)
+
+        return merged_attributes
+
+    def _set_attributes(self, attributes: dict) -> None:
+        self.__dict__ = attributes
 
 
 @partially
@@ -285,13 +323,15 @@ _NO_VALUE = flag_about("_NO_VALUE")
 class val(_AttributeKeeper):
     """Constructor for an `Arbitrary` object with data."""
 
+    __slots__ = ("__special_attr_kinds", )
+
     def __new__(
         cls,
         *objects,
         __call__: Callable[Concatenate[Self, Pm], R] | _NO_VALUE = _NO_VALUE,
         **attributes: Any,
     ) -> "Special[_callable_val[Pm, R], Self] | _temp":
-        attributes = cls._attributes_from(objects) | attributes
+        attributes = cls._attributes_from(objects, attributes)
 
         if __call__ is _NO_VALUE and "__call__" in attributes.keys():
             __call__ = attributes["__call__"]
@@ -301,47 +341,193 @@ class val(_AttributeKeeper):
             | (dict() if __call__ is _NO_VALUE else dict(__call__=__call__))
         )
 
-        if any(contexted(attr).context == _of_temp for attr in attributes.values()):
+        if any(
+            isinstance(attr, ContextualForm) and attr.context == _of_temp
+            for attr in attributes.values()
+        ):
             attributes_for_temp = {
                 _: _temp._unit_of(attr) for _, attr in complete_attributes.items()
             }
             return _temp(*objects, **attributes_for_temp)
 
-        return (
-            _callable_val(*objects, **complete_attributes)
-            if __call__ is not _NO_VALUE and cls is val
-            else super().__new__(cls)
+        if __call__ is not _NO_VALUE and cls is val:
+            return _callable_val(*objects, **complete_attributes)
+
+        instance = super().__new__(
+            _shape_type_of(attributes) if cls is val else cls
+        )
+        object.__setattr__(
+            instance, "_val__special_attr_kinds", _NO_SPECIAL_ATTR_KINDS
         )
 
-    def __getattribute__(self, attr_name: str) -> Any:
+        return instance
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if (
+            "__getattribute__" not in cls.__dict__
+            and cls.__getattribute__ is object.__getattribute__
+        ):
+            cls.__getattribute__ = val._contextual_getattribute
+
+    def __copy__(self) -> Self:
+        clone = object.__new__(object.__getattribute__(self, "__class__"))
+
+        object.__setattr__(
+            clone, "__dict__", dict(object.__getattribute__(self, "__dict__"))
+        )
+        object.__setattr__(
+            clone,
+            "_val__special_attr_kinds",
+            object.__getattribute__(self, "_val__special_attr_kinds"),
+        )
+
+        return clone
+
+    def __setattr__(self, attr_name: str, value: Any) -> Any:
         if attr_name == "__dict__":
-            return object.__getattribute__(self, attr_name)
+            super().__setattr__(attr_name, value)
+            return val._update_kind(self)
 
         if (
-            attr_name not in self.__dict__.keys()
-            and default_descriptor in self.__dict__.keys()
+            attr_name == default_descriptor
+            or isinstance(value, ContextualForm)
+            or object.__getattribute__(self, "__class__") is _val_with_specials
         ):
-            default_descriptor_ = default_descriptor_of(self)(attr_name)
-            if hasattr(default_descriptor_, "__get__"):
-                return default_descriptor_.__get__(self, type(self))
+            result = val._set(self, attr_name, value)
+            val._update_kind(self)
 
-        value = object.__getattribute__(self, attr_name)
-        context, stored_value = contexted(value)
+            return result
+
+        return val._set(self, attr_name, value)
+
+    def __delattr__(self, attr_name: str) -> Any:
+        result = val._delete(self, attr_name)
+
+        if object.__getattribute__(self, "__class__") is _val_with_specials:
+            val._update_kind(self)
+
+        return result
+
+    def __getstate__(self) -> dict:
+        return object.__getattribute__(self, "__dict__")
+
+    def __reduce__(self) -> tuple:
+        return (object.__new__, (type(self), ), val.__getstate__(self))
+
+    def __setstate__(self, state: dict) -> None:
+        object.__setattr__(self, "__dict__", state)
+        val._update_kind(self)
+
+    def __instancecheck__(self, instance: Any) -> bool:
+        return all(
+            (value := getattr(instance, name, _NO_VALUE)) is not _NO_VALUE
+            and value == attr
+            for name, attr in object.__getattribute__(self, "__dict__").items()
+        )
+
+    @staticmethod
+    @partially
+    def to_attr(
+        attr_name: str,
+        action: Callable[Optional[V], R],
+        *,
+        mutably: bool = False,
+    ) -> Callable[O, Self]:
+        return fun(val |then>> to_attr(attr_name, action, mutably=mutably))
+
+    @staticmethod
+    def _for_setting(value: V) -> V:
+        return (
+            value.value
+            if isinstance(value, ContextualForm) and value.context == _filled
+            else value
+        )
+
+    def _contextual_getattribute(self, attr_name: str) -> Any:
+        kind = object.__getattribute__(self, "_val__special_attr_kinds").get(
+            attr_name
+        )
+
+        if kind is not None:
+            _, stored_value = object.__getattribute__(self, attr_name)
+
+            if kind is as_method:
+                return MethodType(stored_value, self)
 
-        if context == as_method:
-            return MethodType(stored_value, self)
-        elif context == as_descriptor:
             return (
                 stored_value.__get__(self, type(self))
                 if hasattr(stored_value, "__get__")
                 else stored_value
             )
-        else:
-            return value
 
-    def __setattr__(self, attr_name: str, value: Any) -> Any:
-        if attr_name == "__dict__":
-            return super().__setattr__(attr_name, value)
+        attributes = object.__getattribute__(self, "__dict__")
+
+        if attr_name in _val_slot_names and attr_name in attributes:
+            return attributes[attr_name]
+
+        if (
+            default_descriptor in attributes
+            and attr_name not in attributes
+            and attr_name != "__dict__"
+        ):
+            default_descriptor_ = default_descriptor_of(self)(attr_name)
+            if hasattr(default_descriptor_, "__get__"):
+                return default_descriptor_.__get__(self, type(self))
+
+        return object.__getattribute__(self, attr_name)
+
+    def _set_attributes(self, attributes: dict) -> None:
+        current_type = object.__getattribute__(self, "__class__")
+
+        if current_type in _shape_types and tuple(attributes) == current_type._shape:
+            for name, attr in attributes.items():
+                object.__setattr__(self, name, attr)
+
+            object.__setattr__(
+                self, "_val__special_attr_kinds", _NO_SPECIAL_ATTR_KINDS
+            )
+            return
+
+        if current_type in _shape_types:
+            object.__setattr__(self, "__class__", val)
+
+        self.__dict__ = attributes
+
+    def _update_kind(self) -> None:
+        attributes = object.__getattribute__(self, "__dict__")
+
+        special_attr_kinds = {
+            name: as_method if attr.context == as_method else as_descriptor
+            for name, attr in attributes.items()
+            if isinstance(attr, ContextualForm)
+            and (attr.context == as_method or attr.context == as_descriptor)
+        }
+        object.__setattr__(
+            self,
+            "_val__special_attr_kinds",
+            special_attr_kinds or _NO_SPECIAL_ATTR_KINDS,
+        )
+
+        current_type = object.__getattribute__(self, "__class__")
+
+        if current_type is not val and current_type not in _hidden_val_types:
+            return
+
+        if (
+            special_attr_kinds
+            or default_descriptor in attributes
+            or "_val__special_attr_kinds" in attributes
+        ):
+            object.__setattr__(self, "__class__", _val_with_specials)
+        elif current_type is _val_with_specials:
+            object.__setattr__(self, "__class__", val)
+
+    def _set(self, attr_name: str, value: Any) -> Any:
+        if attr_name == "_val__special_attr_kinds":
+            self.__dict__[attr_name] = value
+            return val._update_kind(self)
 
         if attr_name not in self.__dict__.keys():
             if default_descriptor in self.__dict__.keys():
@@ -359,15 +545,22 @@ class val(_AttributeKeeper):
             else super().__setattr__(attr_name, value)
         )
 
-    def __delattr__(self, attr_name: str) -> Any:
+    def _delete(self, attr_name: str) -> Any:
         if attr_name == "__dict__":
             return super().__delattr__(attr_name)
 
+        if attr_name == "_val__special_attr_kinds":
+            if attr_name not in self.__dict__.keys():
+                raise AttributeError(attr_name)
+
+            del self.__dict__[attr_name]
+            return val._update_kind(self)
+
         if attr_name not in self.__dict__.keys():
             if default_descriptor in self.__dict__.keys():
-                default_descriptor_ = default_descriptor_of(self)
+                default_descriptor_ = default_descriptor_of(self)(attr_name)
                 if hasattr(default_descriptor_, "__delete__"):
-                    return default_descriptor_of(self).__delete__(self)
+                    return default_descriptor_.__delete__(self)
             else:
                 return super().__delattr__(attr_name)
 
@@ -379,25 +572,72 @@ class val(_AttributeKeeper):
             else super().__delattr__(attr_name)
         )
 
-    def __instancecheck__(self, instance: Any) -> bool:
-        return all(
-            hasattr(instance, name) and getattr(instance, name) == attr
-            for name, attr in dict_of(self).items()
-        )
 
-    @staticmethod
-    @partially
-    def to_attr(
-        attr_name: str,
-        action: Callable[Optional[V], R],
-        *,
-        mutably: bool = False,
-    ) -> Callable[O, Self]:
-        return fun(val |then>> to_attr(attr_name, action, mutably=mutably))
+class _val_with_specials(val):
+    """
+    Hidden variation of `val` for objects with methods, descriptors or a default
+    descriptor.
 
-    @staticmethod
-    def _for_setting(value: V) -> V:
-        return value.value if of(_filled, value) else value
+    Plain `val` objects are read natively and become this variation only while
+    they have such attributes.
+    """
+
+
+_NO_SPECIAL_ATTR_KINDS: dict[str, Any] = dict()
+
+_val_slot_names: frozenset[str] = frozenset((
+    "_val__special_attr_kinds", "_frozenval__hash"
+))
+
+_MAX_SHAPE_TYPE_NUMBER: int = 4096
+
+_shape_types: set[type] = set()
+_shape_type_by_shape: dict[Tuple[str], type] = dict()
+
+_hidden_val_types: set[type] = {_val_with_specials}
+
+
+def _shape_type_of(attributes: Mapping[str, Any]) -> type:
+    """
+    Function to get a hidden variation of `val` whose instances with input
+    attributes share a key table of their `__dict__`.
+
+    Returns `val` itself for objects with methods, descriptors or a default
+    descriptor and when there are too many shapes.
+    """
+
+    if any(isinstance(attr, ContextualForm) for attr in attributes.values()):
+        return val
+
+    shape = tuple(
+        name
+        for name in attributes.keys()
+        if name not in val._ignored_attribute_names
+    )
+    shape_type = _shape_type_by_shape.get(shape)
+
+    if shape_type is not None:
+        return shape_type
+
+    if (
+        default_descriptor in shape
+        or len(_shape_type_by_shape) >= _MAX_SHAPE_TYPE_NUMBER
+        or any(hasattr(getattr_static(val, name, None), "__set__") for name in shape)
+    ):
+        return val
+
+    shape_type = type("val", (val, ), dict(
+        __slots__=tuple(),
+        __module__=__name__,
+        __getattribute__=object.__getattribute__,
+        _shape=shape,
+    ))
+
+    _shape_types.add(shape_type)
+    _hidden_val_types.add(shape_type)
+    _shape_type_by_shape[shape] = shape_type
+
+    return shape_type
 
 
 class _callable_val(val, Generic[Pm, R]):
@@ -405,7 +645,7 @@ class _callable_val(val, Generic[Pm, R]):
 
     def __init__(self, *objects, **attributes):
         super().__init__(*objects, **attributes)
-        assert "__call__" in dict_of(self).keys()
+        assert "__call__" in dict_of_view(self).keys()
 
     def __call__(self, *args: Pm.args, **kwargs: Pm.kwargs) -> R:
         return self.__call__(*args, **kwargs)
@@ -414,17 +654,102 @@ class _callable_val(val, Generic[Pm, R]):
         return (
             call_signature_of(self.__call__)
             if attr_name == "__signature__"
-            else super().__getattribute__(attr_name)
+            else val._contextual_getattribute(self, attr_name)
         )
 
     __or__ = _generating_pipeline(val.__or__)
 
 
+class frozenval(val):
+    """
+    Constructor for an immutable `val` object hashed by its attributes.
+
+    Its hash is computed on the first hashing and cached, so frozen objects
+    with equal attributes are interchangeable as keys.
+    """
+
+    __slots__ = ("__hash", )
+
+    def __new__(cls, *objects, **attributes: Any) -> "Self | _temp":
+        if (
+            cls is frozenval
+            and "__call__" in cls._attributes_from(objects, attributes).keys()
+        ):
+            return _callable_frozenval(*objects, **attributes)
+
+        instance = super().__new__(cls, *objects, **attributes)
+
+        if isinstance(instance, frozenval):
+            object.__setattr__(instance, "_frozenval__hash", None)
+
+        return instance
+
+    def __hash__(self) -> int:
+        hash_ = object.__getattribute__(self, "_frozenval__hash")
+
+        if hash_ is None:
+            hash_ = _table_hash_of(object.__getattribute__(self, "__dict__"))
+            object.__setattr__(self, "_frozenval__hash", hash_)
+
+        return hash_
+
+    def __eq__(self, other: Special[Self]) -> bool:
+        if isinstance(other, frozenval):
+            hash_ = object.__getattribute__(self, "_frozenval__hash")
+            other_hash = object.__getattribute__(other, "_frozenval__hash")
+
+            if hash_ is not None and other_hash is not None and hash_ != other_hash:
+                return False
+
+        return super().__eq__(other)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __add__(self, attr_name: str) -> Self:
+        return (
+            self
+            if hasattr(self, attr_name)
+            else frozenval(self, {attr_name: None})
+        )
+
+    def __sub__(self, attr_name: str) -> Self:
+        attributes = object.__getattribute__(self, "__dict__")
+
+        if attr_name not in attributes.keys():
+            return self
+
+        return frozenval({
+            name: attr for name, attr in attributes.items() if name != attr_name
+        })
+
+    def __setattr__(self, attr_name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"cannot set '{attr_name}' attribute of frozen 'val'")
+
+    def __delattr__(self, attr_name: str) -> NoReturn:
+        raise AttributeError(
+            f"cannot delete '{attr_name}' attribute of frozen 'val'"
+        )
+
+    def __reduce__(self) -> tuple:
+        return (frozenval, (dict(object.__getattribute__(self, "__dict__")), ))
+
+    def _set_attributes(self, attributes: dict) -> None:
+        object.__setattr__(self, "__dict__", attributes)
+        val._update_kind(self)
+
+
+class _callable_frozenval(frozenval, _callable_val):
+    """Variation of `frozenval` for callability."""
+
+
 class _temp(_AttributeKeeper):
     """Constructor for an `Arbitrary` object without data."""
 
+    __slots__ = ("_instance_check_plan", "_instance_check_result_by_type")
+
     def __new__(cls, *objects, **attributes: Any) -> Self | val:
-        attributes = cls._attributes_from(objects) | attributes
+        attributes = cls._attributes_from(objects, attributes)
 
         return (
             val(**{name: value.value for name, value in attributes.items()})
@@ -436,12 +761,16 @@ class _temp(_AttributeKeeper):
         )
 
     def __repr__(self) -> str:
-        return super().__repr__() if dict_of(self) else f"{type(self).__name__}()"
+        return (
+            super().__repr__()
+            if dict_of_view(self)
+            else f"{type(self).__name__}()"
+        )
 
     def __deepcopy__(self, memo) -> Self:
         return _temp(**{
             _: attr.context(deepcopy(attr.value, memo))
-            for _, attr in dict_of(self).items()
+            for _, attr in dict_of_view(self).items()
         })
 
     def __getattribute__(self, name: str) -> Any:
@@ -455,10 +784,19 @@ class _temp(_AttributeKeeper):
             return attr
 
     def __setattr__(self, name: str, value: Any) -> None:
+        _temp._reset_instance_check(self)
+
         partial(super().__setattr__, name)(
             value if name == "__dict__" else _temp._unit_of(value)
         )
 
+    def __delattr__(self, name: str) -> None:
+        _temp._reset_instance_check(self)
+        super().__delattr__(name)
+
+    def __getstate__(self) -> dict:
+        return object.__getattribute__(self, "__dict__")
+
     def __call__(self, *attrs, **kwattrs) -> val:
         names_to_fill = tuple(
             name
@@ -477,17 +815,48 @@ class _temp(_AttributeKeeper):
         return self & val(dict(zip(names_to_fill, attrs)), kwattrs)
 
     def __instancecheck__(self, instance: Any) -> bool:
+        plan, result_by_type = _temp._instance_check_of(self)
+        instance_type = builtins.type(instance)
+
+        result = result_by_type.get(instance_type)
+
+        if result is None:
+            result = _type_level_instance_check_of(plan, instance_type)
+            result_by_type[instance_type] = result
+
+        if result is not _NO_VALUE:
+            return result
+
         return all(
-            (
-                (
-                    hasattr(instance, name)
-                    and attr.value == getattr(instance, name)
-                )
-                if attr.context == _filled
-                else hasattr(instance, name)
+            (value := getattr(instance, name, _NO_VALUE)) is not _NO_VALUE
+            and (expected is _NO_VALUE or expected == value)
+            for name, expected in plan
+        )
+
+    def _instance_check_of(self) -> tuple[tuple, WeakKeyDictionary]:
+        try:
+            plan = object.__getattribute__(self, "_instance_check_plan")
+        except AttributeError:
+            plan = None
+
+        if plan is not None:
+            return plan, object.__getattribute__(
+                self, "_instance_check_result_by_type"
             )
-            for name, attr in dict_of(self).items()
+
+        plan = tuple(
+            (name, attr.value if attr.context == _filled else _NO_VALUE)
+            for name, attr in object.__getattribute__(self, "__dict__").items()
         )
+        result_by_type = WeakKeyDictionary()
+
+        object.__setattr__(self, "_instance_check_plan", plan)
+        object.__setattr__(self, "_instance_check_result_by_type", result_by_type)
+
+        return plan, result_by_type
+
+    def _reset_instance_check(self) -> None:
+        object.__setattr__(self, "_instance_check_plan", None)
 
     @staticmethod
     def _unit_of(value: V) -> _to_fill[V] | _filled[V]:
@@ -501,11 +870,58 @@ class _temp(_AttributeKeeper):
     def _for_setting(value: V) -> _filled[V] | _to_fill[V]:
         return (
             value
-            if contexted(value).context == _filled
+            if isinstance(value, ContextualForm) and value.context == _filled
             else be(_to_fill, value)
         )
 
 
+_STATIC_ATTRIBUTE_TYPES: Final[tuple] = (
+    FunctionType,
+    BuiltinFunctionType,
+    WrapperDescriptorType,
+    MethodDescriptorType,
+    staticmethod,
+    classmethod,
+)
+
+
+def _type_level_instance_check_of(
+    plan: Tuple[tuple[str, Any]],
+    type_: type,
+) -> bool | _NO_VALUE:
+    """
+    Function to check all instances of an input type by a plan of a template
+    when it depends only on the type.
+
+    Returns `_NO_VALUE` when instances must be checked individually.
+    """
+
+    if (
+        any(expected is not _NO_VALUE for _, expected in plan)
+        or type_.__getattribute__ is not object.__getattribute__
+        or getattr_static(type_, "__getattr__", None) is not None
+    ):
+        return _NO_VALUE
+
+    result = True
+
+    for name, _ in plan:
+        attr = getattr_static(type_, name, _NO_VALUE)
+
+        if attr is _NO_VALUE:
+            if type_.__dictoffset__ == 0:
+                return False
+
+            result = _NO_VALUE
+        elif (
+            not isinstance(attr, _STATIC_ATTRIBUTE_TYPES)
+            and hasattr(builtins.type(attr), "__get__")
+        ):
+            result = _NO_VALUE
+
+    return result
+
+
 class type(type):
     __builtin_type = type
 
@@ -520,9 +936,16 @@ class type(type):
             return cls.__builtin_type(value, bases, dict, **kwargs)
         elif value is None:
             return _temp(**kwargs)
-        else:
+        elif kwargs:
             return cls.__builtin_type(value, **kwargs)
 
+        type_ = cls.__builtin_type(value)
+
+        while type_ in _hidden_val_types:
+            type_ = type_.__base__
+
+        return type_
+
 
 type_ = type
 
@@ -533,6 +956,8 @@ class constructor:
         type(value_of=Callable[O, V])
         | type(combine=Callable[[V, V], V])
         | type(with_field=Callable[[V, str, F], V])
+        | type(with_fields=Callable[[V, Mapping[str, F]], V])
+        | type(many=Callable[Iterable[O], Tuple[R]])
         | type(construct=Callable[V, R])
         | type(default_value=V)
     )
@@ -550,7 +975,18 @@ class constructor:
     def __call__(actions: _Actions) -> R:
         actions = constructor._default_actions & actions
 
-        def construct(*objects: O, **fields: F) -> R:
+        def with_fields_of(fields: Mapping[str, F]) -> Callable[V, V]:
+            if not fields:
+                return _get
+            elif hasattr(actions, "with_fields"):
+                return lambda object_: actions.with_fields(object_, fields)
+            else:
+                return ActionChain(
+                    actions.with_field |by* (name, value)
+                    for name, value in fields.items()
+                )
+
+        def constructed(objects: Tuple[O], with_fields: Callable[V, V]) -> R:
             values = tuple(map(actions.value_of, objects))
 
             if len(values) == 0:
@@ -560,30 +996,43 @@ class constructor:
             else:
                 combination = reduce(actions.combine, values)
 
-            with_fields = ActionChain(
-                actions.with_field |by* (name, value)
-                for name, value in fields.items()
-            )
-
             return actions.construct(with_fields(combination))
 
-        return val(actions, __call__=construct)
+        def construct(*objects: O, **fields: F) -> R:
+            return constructed(objects, with_fields_of(fields))
+
+        def many(rows: Iterable[O], /, **fields: F) -> Tuple[R]:
+            with_fields = with_fields_of(fields)
+
+            return tuple(constructed((row, ), with_fields) for row in rows)
+
+        return val(dict(many=many), actions, __call__=construct)
 
 
 @constructor
 class obj:
     def value_of(object: Any) -> val:
-        value_object = val(object)
+        return val(obj._attributes_of(object))
 
-        for name, value in dict_of(object).items():
-            if callable(value):
-                setattr(value_object, name, obj._as_method(value))
+    def many(rows: Iterable[Any], /, **fields: Any) -> Tuple[val]:
+        field_attributes = obj._attributes_of(fields)
 
-        return value_object
+        return tuple(
+            val(obj._attributes_of(row), field_attributes) for row in rows
+        )
 
     def with_field(object: val, name: str, value: Any) -> val:
         return object & val({name: obj._as_method(value)})
 
+    def with_fields(object: val, fields: Mapping[str, Any]) -> val:
+        return val(object, obj._attributes_of(fields))
+
+    def _attributes_of(object: Any) -> dict[str, Any]:
+        return {
+            name: obj._as_method(value)
+            for name, value in dict_of_view(object).items()
+        }
+
     def _as_method(
         value: Special[Special[staticmethod, ActionT], V],
     ) -> as_method[ActionT] | V:
@@ -594,30 +1043,56 @@ class obj:
         )
 
 
+_StructFieldPlan: TypeAlias = Tuple[
+    tuple[str, Any, Optional[Callable[[], Any]]]
+]
+
+_struct_field_plan_by_class: WeakKeyDictionary[type, _StructFieldPlan]
+_struct_field_plan_by_class = WeakKeyDictionary()
+
+
 @constructor
 class struct:
-    def value_of(object: Any) -> val:
+    def value_of(object: Any) -> _temp:
+        return _temp({
+            name: value if default_factory is None else _filled(default_factory())
+            for name, value, default_factory in struct._field_plan_of(object)
+        })
+
+    def with_field(object: Arbitrary, name: str, value: Any) -> _temp:
+        return object & _temp({name: value})
+
+    def with_fields(object: Arbitrary, fields: Mapping[str, Any]) -> _temp:
+        return object & _temp(fields)
+
+    def _field_plan_of(class_: type) -> _StructFieldPlan:
+        field_plan = _struct_field_plan_by_class.get(class_)
+
+        if field_plan is not None:
+            return field_plan
+
         dataclass_ = (
-            object if hasattr(object, "__dataclass_fields__") else dataclass(object)
+            class_ if hasattr(class_, "__dataclass_fields__") else dataclass(class_)
         )
 
-        return _temp({
-            field.name: when(
+        field_plan = tuple(
+            when(
                 (
                     lambda f: f.default is not MISSING,
-                    attrgetter("default") |then>> _filled,
+                    lambda f: (f.name, _filled(f.default), None),
                 ),
                 (
                     lambda f: f.default_factory is not MISSING,
-                    methodcaller("default_factory") |then>> _filled,
+                    lambda f: (f.name, None, f.default_factory),
                 ),
-                (..., attrgetter("type")),
+                (..., lambda f: (f.name, f.type, None)),
             )(field)
-            for field in dict_of(dataclass_)["__dataclass_fields__"].values()
-        })
+            for field in dict_of_view(dataclass_)["__dataclass_fields__"].values()
+        )
 
-    def with_field(object: Arbitrary, name: str, value: Any) -> _temp:
-        return object & _temp({name: value})
+        _struct_field_plan_by_class[class_] = field_plan
+
+        return field_plan
 
 
 def namespace(annotated: _temp(__annotations__=Iterable[str])) -> val:
@@ -629,15 +1104,15 @@ def namespace(annotated: _temp(__annotations__=Iterable[str])) -> val:
 @partially
 def is_templated(attr_name: str, obj_: Special[_temp]) -> bool:
     return (
-        attr_name in dict_of(obj_).keys()
-        and contexted(dict_of(obj_)[attr_name]).context == _to_fill
+        attr_name in dict_of_view(obj_).keys()
+        and contexted(dict_of_view(obj_)[attr_name]).context == _to_fill
     )
 
 
 def templated_attrs_of(obj_: Special[_temp]) -> OrderedDict[str, Any]:
     return OrderedDict(
         (name, attr.value)
-        for name, attr in dict_of(obj_).items()
+        for name, attr in dict_of_view(obj_).items()
         if contexted(attr).context == _to_fill
     )
 
@@ -649,7 +1124,17 @@ def hash_of(value: Any) -> int:
 
 
 def _table_hash_of(table: Mapping) -> int:
-    return sum(hash_of(name) + hash_of(attr) for name, attr in table.items())
+    return hash(frozenset(
+        (
+            name,
+            (
+                (builtins.type(attr), *attr)
+                if isinstance(attr, ContextualForm)
+                else attr
+            ),
+        )
+        for name, attr in table.items()
+    ))
 
 
 @partially
@@ -660,45 +1145,104 @@ def expand(object_: O, data: Special[Mapping], /) -> O:
     first input object.
     """
 
-    object_.__dict__ = dict_of(object_) | dict_of(data)
+    object_.__dict__ = dict_of(object_) | dict_of_view(data)
 
 
 from_ = partially(flipped(expand))
 
 
 @partially
-def like(
-    imitating: Special[V],
-    original: Special[V],
-    *,
-    _ids_of_found_values: Tuple[int] = tuple(),
-) -> bool:
+def like(imitating: Special[V], original: Special[V]) -> bool:
     """
     Predicate to compare two objects by value.
     An `imitating` object type must be covariant with an `original` object type.
+
+    Objects referring to themselves are not alike.
     """
 
-    return (
-        imitating == original
-        or hasattr(original, "__dict__")
-        and isinstance(imitating, type(original))
-        and id(imitating) not in _ids_of_found_values
-        and id(original) not in _ids_of_found_values
-        and (
-            dict_of(original) == dict()
-            or not set(dict_of(original).keys()) - set(dict_of(imitating).keys())
-        )
-        and all(
-            like(
-                dict_of(imitating)[attr_name],
-                original_attr_value,
-                _ids_of_found_values=(
-                    *_ids_of_found_values, id(imitating), id(original)
-                ),
-            )
-            for attr_name, original_attr_value in dict_of(original).items()
-        )
-    )
+    return mismatch_path_of(imitating, original) is None
+
+
+@partially
+def mismatch_path_of(
+    imitating: Special[V],
+    original: Special[V],
+) -> Optional[Tuple[str]]:
+    """
+    Function to get names of attributes leading to the first values, for which
+    the `like` predicate is false, or `None` when objects are alike.
+    """
+
+    step = _like_step_of(imitating, original)
+
+    if step is True:
+        return None
+    elif step is False:
+        return tuple()
+
+    root_pair = (id(imitating), id(original))
+    imitating_attrs, original_attrs = step
+
+    frames = [(root_pair, imitating_attrs, iter(original_attrs.items()))]
+    path = list()
+
+    compared_pairs = {root_pair}
+    like_pairs = set()
+    compared_values = [(imitating, original)]
+
+    while frames:
+        pair, imitating_attrs, original_attr_items = frames[-1]
+
+        for attr_name, original_attr in original_attr_items:
+            imitating_attr = imitating_attrs[attr_name]
+            attr_pair = (id(imitating_attr), id(original_attr))
+
+            if attr_pair in like_pairs:
+                continue
+
+            step = _like_step_of(imitating_attr, original_attr)
+
+            if step is True:
+                continue
+            elif step is False or attr_pair in compared_pairs:
+                return (*path, attr_name)
+
+            path.append(attr_name)
+            compared_pairs.add(attr_pair)
+            compared_values.append((imitating_attr, original_attr))
+            frames.append((attr_pair, step[0], iter(step[1].items())))
+            break
+        else:
+            frames.pop()
+            compared_pairs.remove(pair)
+            like_pairs.add(pair)
+
+            if path:
+                path.pop()
+
+    return None
+
+
+def _like_step_of(
+    imitating: Special[V],
+    original: Special[V],
+) -> bool | tuple[dict, dict]:
+    if imitating == original:
+        return True
+
+    if (
+        not hasattr(original, "__dict__")
+        or not isinstance(imitating, type(original))
+    ):
+        return False
+
+    imitating_attrs = dict_of_view(imitating)
+    original_attrs = dict_of_view(original)
+
+    if original_attrs.keys() - imitating_attrs.keys():
+        return False
+
+    return imitating_attrs, original_attrs
 
 
 @partially
@@ -753,34 +1297,25 @@ def sculpture_of(
 ) -> val:
     """Constructor for objects with proxied descriptors to an input value."""
 
-    proxy_property_to_original_by = _sculpture_property_of |by| original
+    sculpture_type = _sculpture_type_of(type(original), descriptor_by_attr_name)
 
-    sculpture_attr_of = (
-        _as_sculpture_descriptor
-        |then>> proxy_property_to_original_by
-        |then>> as_descriptor
-    )
-
-    def default_sculpture_descriptor_for(attr_name: str):
-        return proxy_property_to_original_by(property(
-            lambda a: getattr(a, attr_name),
-            lambda a, b: setattr(a, attr_name, b),
-            lambda a: delattr(a, attr_name),
+    if sculpture_type is val:
+        return val(_sculpture_attributes_of(
+            _sculpture_accessors_by_name_of(type(original), descriptor_by_attr_name),
+            original,
         ))
 
-    sculpture = (
-        val({
-            _: sculpture_attr_of(descriptor)
-            for _, descriptor in descriptor_by_attr_name.items()
-        })
-        & val(_sculpture_original=original)
-    )
+    attributes = dict(sculpture_type._sculpture_attributes)
+    attributes["_sculpture_original"] = original
 
-    return with_default_descriptor(
-        default_sculpture_descriptor_for,
-        sculpture,
+    sculpture = object.__new__(sculpture_type)
+    object.__setattr__(sculpture, "__dict__", attributes)
+    object.__setattr__(
+        sculpture, "_val__special_attr_kinds", sculpture_type._sculpture_attr_kinds
     )
 
+    return sculpture
+
 
 original_of: Callable[Any, Any]
 original_of = documenting_by(
@@ -842,28 +1377,257 @@ def _as_sculpture_descriptor(
         return value
 
 
-def _sculpture_property_of(descriptor: Any, value: Any) -> property:
-    sculpture_property = property()
+_SculptureAccessors: TypeAlias = Tuple[
+    Optional[Callable[Any, Any]],
+    Optional[Callable[[Any, Any], Any]],
+    Optional[Callable[Any, Any]],
+]
 
-    if hasattr(descriptor, "__set__"):
-        sculpture_property = property(
-            fset=lambda _, v: descriptor.__set__(value, v),
-        )
 
-    if hasattr(descriptor, "__get__"):
-        sculpture_property = property(
-            always(descriptor.__get__, value, type(value)),
-            sculpture_property.fset,
+def _sculpture_accessors_of(
+    descriptor: Any,
+    original_type: type,
+) -> _SculptureAccessors:
+    """
+    Function to get functions getting, setting and deleting an attribute of an
+    original object by a sculpture descriptor.
+    """
+
+    descriptor = _as_sculpture_descriptor(descriptor)
+
+    return (
+        (
+            (lambda original: descriptor.__get__(original, original_type))
+            if hasattr(descriptor, "__get__")
+            else None
+        ),
+        descriptor.__set__ if hasattr(descriptor, "__set__") else None,
+        descriptor.__delete__ if hasattr(descriptor, "__delete__") else None,
+    )
+
+
+def _sculpture_property_of(accessors: _SculptureAccessors) -> property:
+    """
+    Function to get a descriptor of a sculpture from functions accessing an
+    attribute of its original object.
+    """
+
+    get, set_, delete = accessors
+
+    return property(
+        None if get is None else (lambda sculpture: get(original_of(sculpture))),
+        (
+            None
+            if set_ is None
+            else (lambda sculpture, value: set_(original_of(sculpture), value))
+        ),
+        (
+            None
+            if delete is None
+            else (lambda sculpture: delete(original_of(sculpture)))
+        ),
+    )
+
+
+def _default_sculpture_descriptor_of(attr_name: str) -> property:
+    return property(
+        lambda sculpture: getattr(original_of(sculpture), attr_name),
+        lambda sculpture, value: setattr(original_of(sculpture), attr_name, value),
+        lambda sculpture: delattr(original_of(sculpture), attr_name),
+    )
+
+
+def _sculpture_accessors_by_name_of(
+    original_type: type,
+    descriptor_by_attr_name: Mapping[str, Any],
+) -> dict[str, _SculptureAccessors]:
+    return {
+        name: _sculpture_accessors_of(descriptor, original_type)
+        for name, descriptor in descriptor_by_attr_name.items()
+    }
+
+
+def _sculpture_attributes_of(
+    accessors_by_name: Mapping[str, _SculptureAccessors],
+    original: Any,
+) -> dict[str, Any]:
+    attributes = {
+        name: as_descriptor(_sculpture_property_of(accessors))
+        for name, accessors in accessors_by_name.items()
+    }
+    attributes["_sculpture_original"] = original
+    attributes[default_descriptor] = _default_sculpture_descriptor_of
+
+    return attributes
+
+
+_MAX_SCULPTURE_TYPE_NUMBER: int = 1024
+
+_sculpture_types: set[type] = set()
+_sculpture_type_by_key: dict[tuple, type] = dict()
+
+
+def _is_module_level_function(value: Any) -> bool:
+    return isinstance(value, FunctionType) and "<" not in value.__qualname__
+
+
+def _sculpture_key_part_of(descriptor: Any) -> Optional[tuple]:
+    if isinstance(descriptor, str) or _is_module_level_function(descriptor):
+        return (descriptor, )
+
+    if builtins.type(descriptor) is property:
+        functions = (descriptor.fget, descriptor.fset, descriptor.fdel)
+
+        if all(
+            function is None or _is_module_level_function(function)
+            for function in functions
+        ):
+            return (property, *functions)
+
+    return None
+
+
+def _sculpture_type_of(
+    original_type: type,
+    descriptor_by_attr_name: Mapping[str, Any],
+) -> type:
+    """
+    Function to get a hidden variation of `val` for sculptures of objects of an
+    input type with input descriptors.
+
+    Its instances get, set and delete proxied attributes of their originals
+    directly and become a generic `val` when their own attributes change.
+    Returns `val` itself for descriptors other than names and module-level
+    functions or properties of them, when the variation cannot be used or when
+    there are too many variations.
+    """
+
+    key_parts = tuple(
+        (name, _sculpture_key_part_of(descriptor))
+        for name, descriptor in descriptor_by_attr_name.items()
+    )
+
+    if any(part is None for _, part in key_parts):
+        return val
+
+    key = (original_type, *key_parts)
+    sculpture_type = _sculpture_type_by_key.get(key)
+
+    if sculpture_type is not None:
+        return sculpture_type
+
+    if (
+        len(_sculpture_type_by_key) >= _MAX_SCULPTURE_TYPE_NUMBER
+        or "__call__" in descriptor_by_attr_name.keys()
+        or "_sculpture_original" in descriptor_by_attr_name.keys()
+        or default_descriptor in descriptor_by_attr_name.keys()
+        or any(
+            hasattr(getattr_static(val, name, None), "__set__")
+            for name in descriptor_by_attr_name.keys()
         )
+    ):
+        return val
+
+    accessors_by_name = _sculpture_accessors_by_name_of(
+        original_type, descriptor_by_attr_name
+    )
 
-    if hasattr(descriptor, "__delete__"):
-        sculpture_property = property(
-            sculpture_property.fget,
-            sculpture_property.fset,
-            always(descriptor.__delete__, value),
+    get_by_name = {
+        name: get
+        for name, (get, _, _) in accessors_by_name.items()
+        if get is not None
+    }
+    set_by_name = {
+        name: set_
+        for name, (_, set_, _) in accessors_by_name.items()
+        if set_ is not None
+    }
+    delete_by_name = {
+        name: delete
+        for name, (_, _, delete) in accessors_by_name.items()
+        if delete is not None
+    }
+    own_names = frozenset((
+        *accessors_by_name.keys(),
+        "_sculpture_original",
+        default_descriptor,
+        "__dict__",
+    ))
+
+    def __getattribute__(sculpture: val, attr_name: str) -> Any:
+        get = get_by_name.get(attr_name)
+
+        if get is not None:
+            return get(object.__getattribute__(sculpture, "_sculpture_original"))
+
+        if attr_name in own_names:
+            return val._contextual_getattribute(sculpture, attr_name)
+
+        return getattr(
+            object.__getattribute__(sculpture, "_sculpture_original"),
+            attr_name,
         )
 
-    return sculpture_property
+    def __setattr__(sculpture: val, attr_name: str, value: Any) -> Any:
+        set_ = set_by_name.get(attr_name)
+
+        if set_ is not None:
+            return set_(
+                object.__getattribute__(sculpture, "_sculpture_original"),
+                value,
+            )
+
+        if attr_name not in own_names:
+            return setattr(
+                object.__getattribute__(sculpture, "_sculpture_original"),
+                attr_name,
+                value,
+            )
+
+        result = val.__setattr__(sculpture, attr_name, value)
+        _stop_sculpturing(sculpture)
+
+        return result
+
+    def __delattr__(sculpture: val, attr_name: str) -> Any:
+        delete = delete_by_name.get(attr_name)
+
+        if delete is not None:
+            return delete(object.__getattribute__(sculpture, "_sculpture_original"))
+
+        if attr_name not in own_names:
+            return delattr(
+                object.__getattribute__(sculpture, "_sculpture_original"),
+                attr_name,
+            )
+
+        result = val.__delattr__(sculpture, attr_name)
+        _stop_sculpturing(sculpture)
+
+        return result
+
+    sculpture_type = builtins.type("val", (_val_with_specials, ), dict(
+        __slots__=tuple(),
+        __module__=__name__,
+        __getattribute__=__getattribute__,
+        __setattr__=__setattr__,
+        __delattr__=__delattr__,
+        _sculpture_descriptors=tuple(descriptor_by_attr_name.values()),
+        _sculpture_attributes=_sculpture_attributes_of(accessors_by_name, None),
+        _sculpture_attr_kinds={_: as_descriptor for _ in accessors_by_name.keys()},
+    ))
+
+    _sculpture_types.add(sculpture_type)
+    _hidden_val_types.add(sculpture_type)
+    _sculpture_type_by_key[key] = sculpture_type
+
+    return sculpture_type
+
+
+def _stop_sculpturing(sculpture: val) -> None:
+    if object.__getattribute__(sculpture, "__class__") in _sculpture_types:
+        object.__setattr__(sculpture, "__class__", _val_with_specials)
+        val._update_kind(sculpture)
 
 
 @via_indexer
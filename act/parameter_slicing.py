@@ -1,10 +1,10 @@
-from functools import reduce
+from functools import reduce, partial
+from operator import itemgetter
 from typing import Iterable, Callable, Tuple, Self
 
 from act.annotations import Pm, R, D
-from act.data_flow import by
+from act.data_flow import by, always
 from act.representations import code_like_repr_of
-from act.structures import flat
 from act.tools import items_of
 
 
@@ -74,19 +74,59 @@ class _IgnoringCallable:
         self._poisitions = tuple(poisitions)
         self._keywords = tuple(keywords)
 
+        self._taken_args_of = _taken_args_getter_of(self._poisitions)
+        self._keyword_set = frozenset(self._keywords)
+
     def __repr__(self) -> str:
         points = (*self._poisitions, *self._keywords)
 
         return f"take{_indexer_repr_of(points)}({code_like_repr_of(self._action)})"
 
     def __call__(self, *args, **kwargs) -> R:
+        if not kwargs or not self._keyword_set:
+            return self._action(*self._taken_args_of(args))
+
         return self._action(
-            *flat(args[position] for position in self._poisitions),
+            *self._taken_args_of(args),
             **{
                 keyword: _ for keyword, _ in kwargs.items()
-                if keyword in self._keywords
+                if keyword in self._keyword_set
             },
         )
 
 
+def _taken_args_getter_of(
+    positions: Tuple[int | slice],
+) -> Callable[tuple, tuple]:
+    """
+    Function to get a function taking arguments at input positions, compiled
+    once for them.
+    """
+
+    if len(positions) == 0:
+        return always(tuple)
+    elif len(positions) == 1 and isinstance(positions[0], slice):
+        return itemgetter(positions[0])
+    elif not all(isinstance(position, int) for position in positions):
+        return partial(_taken_args_of, positions)
+    elif len(positions) == 1:
+        position = positions[0]
+
+        return lambda args: (args[position], )
+    else:
+        return itemgetter(*positions)
+
+
+def _taken_args_of(positions: Tuple[int | slice], args: tuple) -> tuple:
+    taken_args = list()
+
+    for position in positions:
+        if isinstance(position, slice):
+            taken_args.extend(args[position])
+        else:
+            taken_args.append(args[position])
+
+    return tuple(taken_args)
+
+
 take = _ArgumentSlicer("take", decorator=_IgnoringCallable)
@@ -40,21 +40,30 @@ class _Partially(ActionReprMixnin):
 
     def __init__(self, action: Callable[Pm, R], required: Optional[int] = None):
         self._action = action
-        self.__force_required = required
-
-    @cached_property
-    def _required(self) -> int:
-        required = self.__force_required
-        del self.__force_required
+        self._is_required_inspected = required is None
 
         if required is not None:
-            return required
+            self._required = required
 
+    @cached_property
+    def _required(self) -> int:
         return _required_number_of(self._action)
 
     def __call__(self, *args, **kwargs) -> Any | Self:
         partial_applied_action = partial(self._action, *args, **kwargs)
 
+        if self._is_required_inspected and not kwargs:
+            required = self._required - len(args)
+
+            if required == 0:
+                return partial_applied_action()
+
+            elif required > 0:
+                next_partially = _Partially(partial_applied_action, required)
+                next_partially._is_required_inspected = True
+
+                return next_partially
+
         if _required_number_of(partial_applied_action) == 0:
             return partial_applied_action()
 
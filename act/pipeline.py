@@ -1,4 +1,4 @@
-from functools import wraps, cached_property
+from functools import wraps
 from operator import not_
 from typing import (
     Callable, Generic, Iterable, Iterator, Self, Any, Tuple, TypeAlias,
@@ -71,31 +71,32 @@ class ActionChain(Generic[ActionT]):
     """
 
     def __init__(self, actions: Iterable[ActionT | Self] = tuple()):
-        self.__raw_actions = actions
+        self._actions = ActionChain._flat_actions_of(actions)
+        self._main_action = ActionChain._main_action_of(self._actions)
 
-    @cached_property
-    def _actions(self) -> Tuple[ActionT]:
+    @staticmethod
+    def _flat_actions_of(actions: Iterable[ActionT | Self]) -> Tuple[ActionT]:
         new_actions = list()
 
-        for action in self.__raw_actions:
+        for action in actions:
             if isinstance(action, ActionChain):
                 new_actions.extend(action)
             else:
                 new_actions.append(action)
 
-        del self.__raw_actions
-
         return tuple(new_actions)
 
-    @cached_property
-    def _main_action(self) -> ActionT:
-        if len(self._actions) == 0:
+    @staticmethod
+    def _main_action_of(actions: Tuple[ActionT]) -> ActionT:
+        if len(actions) == 0:
             return _get
 
+        first_action, *next_actions = actions
+
         def main_action(*args, **kwargs):
-            result = self._actions[0](*args, **kwargs)
+            result = first_action(*args, **kwargs)
 
-            for action in self._actions[1:]:
+            for action in next_actions:
                 result = action(result)
 
             return result
@@ -1,30 +1,54 @@
-from inspect import stack
-from operator import attrgetter
-from typing import Any
-
-from act.synonyms import times
+from inspect import CO_OPTIMIZED
+from sys import _getframe
+from types import CodeType, FrameType
+from typing import Any, Optional
+import builtins
 
 
 __all__ = ("back_scope_in", "value_in")
 
 
-def back_scope_in(number_of_backs: int, /):
+def back_scope_in(number_of_backs: int, /) -> Optional[FrameType]:
     """Function to get scope up the call stack starting from the called scope."""
 
-    scope = times(number_of_backs)(attrgetter("f_back"))(stack()[1][0])
-
-    return scope
+    try:
+        return _getframe(number_of_backs + 1)
+    except ValueError:
+        return None
 
 
 def value_in(name: str, /, *, scope_in: int = 0) -> Any:
     """Function to get value from an external scope."""
 
-    scope = back_scope_in(scope_in + 1)
+    try:
+        scope = _getframe(scope_in + 1)
+    except ValueError:
+        scope = None
+
+    if scope is None:
+        builtin_values = vars(builtins)
+    else:
+        if _may_be_local_in(scope.f_code, name):
+            local_values = scope.f_locals
+
+            if name in local_values:
+                return local_values[name]
 
-    if scope is not None:
-        if name in scope.f_locals.keys():
-            return scope.f_locals[name]
-        elif name in scope.f_globals.keys():
+        if name in scope.f_globals:
             return scope.f_globals[name]
 
-    return eval(name)
+        builtin_values = scope.f_builtins
+
+    if name in builtin_values:
+        return builtin_values[name]
+
+    raise NameError(f"name {name!r} is not defined")
+
+
+def _may_be_local_in(code: CodeType, name: str) -> bool:
+    return (
+        not code.co_flags & CO_OPTIMIZED
+        or name in code.co_varnames
+        or name in code.co_cellvars
+        or name in code.co_freevars
+    )
@@ -1,22 +1,23 @@
-from collections import OrderedDict
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from itertools import chain, islice
 from math import copysign
-from operator import methodcaller, contains
-from types import MappingProxyType
+from operator import methodcaller, contains, attrgetter, itemgetter
 from typing import (
     Iterable, Tuple, Callable, Mapping, TypeAlias, Optional, Self, Iterator,
-    Generator
+    Generator, Sequence, Any, Generic, Final, ItemsView, ValuesView
 )
 
 from pyannotating import many_or_one, Special
 
 from act.annotations import V, M, K, I, W, Unia
 from act.atomization import fun
-from act.contexting import ContextualForm, contexted, contextualizing, saving_context
+from act.contexting import ContextualForm, contexted, contextualizing, of
 from act.data_flow import io, by, and_via_indexer, indexer_of
 from act.errors import RangeConstructionError, IndexingError
 from act.flags import flag_about
 from act.objects import val
-from act.partiality import partial, rpartial, partially, will, rwill
+from act.partiality import partial, rpartial, partially, rwill
 from act.pipeline import then, bind_by, ActionChain
 from act.protocols import Hashable
 from act.representations import code_like_repr_of
@@ -38,6 +39,7 @@ __all__ = (
     "slice_from",
     "interval",
     "Interval",
+    "IntervalSet",
     "ranges_from",
     "range_from",
     "filled",
@@ -50,7 +52,350 @@ __all__ = (
 )
 
 
-frozendict: TypeAlias = MappingProxyType
+_SMALL_FROZENDICT_SIZE: Final[int] = 8
+_TRIE_HASH_MASK: Final[int] = 2 ** 64 - 1
+_TRIE_LEVEL_BITS: Final[int] = 5
+
+_NO_ENTRY: Final[object] = object()
+
+
+class _TrieNode:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int = 0, entries: tuple = tuple()):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _TrieCollisionNode:
+    __slots__ = ("entries", )
+
+    def __init__(self, entries: tuple):
+        self.entries = entries
+
+
+_TrieLeaf: TypeAlias = tuple[int, K, int, V]
+_Trie: TypeAlias = _TrieNode | _TrieCollisionNode
+
+
+def _trie_hash_of(key: Hashable) -> int:
+    return hash(key) & _TRIE_HASH_MASK
+
+
+def _trie_leaf_in(trie: _Trie, hash_: int, key: K) -> _TrieLeaf | object:
+    shift = 0
+
+    while type(trie) is _TrieNode:
+        bit = 1 << ((hash_ >> shift) & 31)
+
+        if not trie.bitmap & bit:
+            return _NO_ENTRY
+
+        entry = trie.entries[(trie.bitmap & (bit - 1)).bit_count()]
+
+        if type(entry) is tuple:
+            return (
+                entry
+                if entry[0] == hash_ and (entry[1] is key or entry[1] == key)
+                else _NO_ENTRY
+            )
+
+        trie = entry
+        shift += _TRIE_LEVEL_BITS
+
+    for leaf in trie.entries:
+        if leaf[1] is key or leaf[1] == key:
+            return leaf
+
+    return _NO_ENTRY
+
+
+def _trie_with(trie: _Trie, leaf: _TrieLeaf, shift: int = 0) -> _Trie:
+    if type(trie) is _TrieCollisionNode:
+        return _TrieCollisionNode((
+            *(entry for entry in trie.entries if entry[1] != leaf[1]),
+            leaf,
+        ))
+
+    bit = 1 << ((leaf[0] >> shift) & 31)
+    index = (trie.bitmap & (bit - 1)).bit_count()
+    entries = trie.entries
+
+    if not trie.bitmap & bit:
+        return _TrieNode(
+            trie.bitmap | bit,
+            (*entries[:index], leaf, *entries[index:]),
+        )
+
+    entry = entries[index]
+
+    if type(entry) is not tuple:
+        new_entry = _trie_with(entry, leaf, shift + _TRIE_LEVEL_BITS)
+    elif entry[0] == leaf[0] and (entry[1] is leaf[1] or entry[1] == leaf[1]):
+        new_entry = leaf
+    elif shift + _TRIE_LEVEL_BITS >= 64:
+        new_entry = _TrieCollisionNode((entry, leaf))
+    else:
+        new_entry = _trie_with(
+            _trie_with(_TrieNode(), entry, shift + _TRIE_LEVEL_BITS),
+            leaf,
+            shift + _TRIE_LEVEL_BITS,
+        )
+
+    return _TrieNode(
+        trie.bitmap,
+        (*entries[:index], new_entry, *entries[index + 1:]),
+    )
+
+
+def _trie_without(trie: _Trie, hash_: int, key: K, shift: int = 0) -> _Trie:
+    if type(trie) is _TrieCollisionNode:
+        return _TrieCollisionNode(tuple(
+            entry for entry in trie.entries if entry[1] != key
+        ))
+
+    bit = 1 << ((hash_ >> shift) & 31)
+    index = (trie.bitmap & (bit - 1)).bit_count()
+    entry = trie.entries[index]
+
+    if type(entry) is not tuple:
+        entry = _trie_without(entry, hash_, key, shift + _TRIE_LEVEL_BITS)
+
+        if entry.entries:
+            return _TrieNode(
+                trie.bitmap,
+                (*trie.entries[:index], entry, *trie.entries[index + 1:]),
+            )
+
+    return _TrieNode(
+        trie.bitmap & ~bit,
+        (*trie.entries[:index], *trie.entries[index + 1:]),
+    )
+
+
+def _trie_leaves_of(trie: _Trie) -> Generator[_TrieLeaf, None, None]:
+    for entry in trie.entries:
+        if type(entry) is tuple:
+            yield entry
+        else:
+            yield from _trie_leaves_of(entry)
+
+
+class frozendict(Mapping, Generic[K, V]):
+    """
+    Persistent immutable `Mapping` preserving insertion order.
+
+    Small mappings are stored in a `dict`, larger ones in a hash array mapped
+    trie, so `set`, `delete` and `|` create new mappings in O(log n) sharing
+    unchanged parts with an original one.
+
+    Hashable by its items with a cached hash.
+    """
+
+    __slots__ = ("_table", "_trie", "_size", "_next_order", "_items", "_hash")
+
+    def __init__(
+        self,
+        items: Mapping[K, V] | Iterable[tuple[K, V]] = tuple(),
+        /,
+        **kwargs: V,
+    ):
+        if type(items) is frozendict and not kwargs:
+            self._set_state_of(items)
+            return
+
+        self._set_state(dict(), None, 0, 0)
+
+        items = dict(items, **kwargs)
+
+        if len(items) <= _SMALL_FROZENDICT_SIZE:
+            self._set_state(items, None, len(items), len(items))
+        else:
+            self._set_state_of(self.merged_with(items))
+
+    def __repr__(self) -> str:
+        return f"frozendict({dict(self._items_of())})"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[K]:
+        return (key for key, _ in self._items_of())
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _NO_ENTRY) is not _NO_ENTRY
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _NO_ENTRY)
+
+        if value is _NO_ENTRY:
+            raise KeyError(key)
+
+        return value
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        if self._table is not None:
+            return self._table.get(key, default)
+
+        leaf = _trie_leaf_in(self._trie, _trie_hash_of(key), key)
+
+        return default if leaf is _NO_ENTRY else leaf[3]
+
+    def items(self) -> ItemsView[K, V]:
+        return _FrozendictItemsView(self)
+
+    def values(self) -> ValuesView[V]:
+        return _FrozendictValuesView(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            other.get(key, _NO_ENTRY) == value for key, value in self._items_of()
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._items_of()))
+
+        return self._hash
+
+    def __or__(self, other: Mapping[K, V]) -> Self:
+        return (
+            self.merged_with(other)
+            if isinstance(other, Mapping)
+            else NotImplemented
+        )
+
+    def __ror__(self, other: Mapping[K, V]) -> Self:
+        return (
+            frozendict(other).merged_with(self)
+            if isinstance(other, Mapping)
+            else NotImplemented
+        )
+
+    def __reduce__(self) -> tuple:
+        return (frozendict, (dict(self._items_of()), ))
+
+    def set(self, key: K, value: V) -> Self:
+        """Method to get a mapping with an input key set to an input value."""
+
+        return self.merged_with(((key, value), ))
+
+    def delete(self, key: K) -> Self:
+        """
+        Method to get a mapping without an input key.
+        Raises `KeyError` when there is no such key.
+        """
+
+        if key not in self:
+            raise KeyError(key)
+
+        if self._table is not None:
+            table = dict(self._table)
+            del table[key]
+
+            return self._of(table, None, self._size - 1, self._next_order)
+
+        return self._of(
+            None,
+            _trie_without(self._trie, _trie_hash_of(key), key),
+            self._size - 1,
+            self._next_order,
+        )
+
+    def merged_with(self, other: Mapping[K, V] | Iterable[tuple[K, V]]) -> Self:
+        """Method to get a mapping with all items of an input mapping set."""
+
+        items = other.items() if isinstance(other, Mapping) else other
+
+        if self._table is not None:
+            table = dict(self._table)
+            table.update(items)
+
+            if len(table) <= _SMALL_FROZENDICT_SIZE:
+                return self._of(table, None, len(table), len(table))
+
+            trie = _TrieNode()
+            size = 0
+            next_order = 0
+            items = table.items()
+        else:
+            trie = self._trie
+            size = self._size
+            next_order = self._next_order
+
+        for key, value in items:
+            hash_ = _trie_hash_of(key)
+            leaf = _trie_leaf_in(trie, hash_, key)
+
+            if leaf is _NO_ENTRY:
+                order = next_order
+                next_order += 1
+                size += 1
+            else:
+                order = leaf[2]
+
+            trie = _trie_with(trie, (hash_, key, order, value))
+
+        return self._of(None, trie, size, next_order)
+
+    def _items_of(self) -> Tuple[tuple[K, V]]:
+        if self._items is None:
+            self._items = (
+                tuple(self._table.items())
+                if self._table is not None
+                else tuple(
+                    (leaf[1], leaf[3])
+                    for leaf in sorted(
+                        _trie_leaves_of(self._trie),
+                        key=itemgetter(2),
+                    )
+                )
+            )
+
+        return self._items
+
+    @classmethod
+    def _of(
+        cls,
+        table: Optional[dict],
+        trie: Optional[_Trie],
+        size: int,
+        next_order: int,
+    ) -> Self:
+        mapping = cls.__new__(cls)
+        mapping._set_state(table, trie, size, next_order)
+
+        return mapping
+
+    def _set_state(
+        self,
+        table: Optional[dict],
+        trie: Optional[_Trie],
+        size: int,
+        next_order: int,
+    ) -> None:
+        self._table = table
+        self._trie = trie
+        self._size = size
+        self._next_order = next_order
+        self._items = None
+        self._hash = None
+
+    def _set_state_of(self, other: Self) -> None:
+        self._set_state(other._table, other._trie, other._size, other._next_order)
+
+
+class _FrozendictItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return iter(self._mapping._items_of())
+
+
+class _FrozendictValuesView(ValuesView):
+    def __iter__(self) -> Iterator[V]:
+        return (value for _, value in self._mapping._items_of())
 
 
 as_collection: Callable[[many_or_one[V]], Tuple[V]]
@@ -261,31 +606,187 @@ def _range_from_slice(slice_: slice, *, limit: Optional[int]) -> range:
     return range(start, stop, step)
 
 
+class IntervalSet:
+    """
+    Class of a normalized set of integer points stored as sorted disjoint
+    `range`s with step 1.
+
+    Merges via `|`, intersects via `&`, subtracts via `-` and gets a complement
+    within a `range` via `complement` working only with `range` endpoints.
+    Points of `range`s with another step are stored as separate `range`s.
+
+    Iterable over its `range`s. By `in` checks for a point.
+
+    To create from an unstructured `Interval`, use the `of` classmethod.
+    """
+
+    def __init__(self, ranges: Iterable[range] = tuple()):
+        self._ranges = self.__normalized(ranges)
+
+    @classmethod
+    def of(cls, interval: Interval, *, limit: Optional[int] = None) -> Self:
+        """
+        Method to create a set from an unstructured `Interval`.
+
+        When a `limit` is passed, resolves negative points from the end of the
+        `limit` and keeps only points inside `range(limit)`.
+        """
+
+        if isinstance(interval, IntervalSet) and limit is None:
+            return interval
+
+        ranges = ranges_from(interval, limit=limit)
+
+        return cls(
+            ranges
+            if limit is None
+            else flat(tmap(partial(_resolved_ranges_of, limit=limit), ranges))
+        )
+
+    @property
+    def start(self) -> Optional[int]:
+        return self._ranges[0].start if self._ranges else None
+
+    @property
+    def stop(self) -> Optional[int]:
+        return self._ranges[-1].stop if self._ranges else None
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({', '.join(map(str, self._ranges))})"
+
+    def __iter__(self) -> Iterator[range]:
+        return iter(self._ranges)
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, IntervalSet) and self._ranges == other._ranges
+
+    def __contains__(self, point: int) -> bool:
+        index = bisect_right(self._ranges, point, key=attrgetter("start")) - 1
+
+        return index >= 0 and point in self._ranges[index]
+
+    def __or__(self, other: Interval) -> Self:
+        return type(self)((*self._ranges, *type(self).of(other)))
+
+    def __and__(self, other: Interval) -> Self:
+        first_ranges = self._ranges
+        second_ranges = type(self).of(other)._ranges
+
+        intersections = list()
+        first_index = 0
+        second_index = 0
+
+        while first_index < len(first_ranges) and second_index < len(second_ranges):
+            first = first_ranges[first_index]
+            second = second_ranges[second_index]
+
+            start = max(first.start, second.start)
+            stop = min(first.stop, second.stop)
+
+            if start < stop:
+                intersections.append(range(start, stop))
+
+            if first.stop < second.stop:
+                first_index += 1
+            else:
+                second_index += 1
+
+        return type(self)(intersections)
+
+    def __sub__(self, other: Interval) -> Self:
+        if not self._ranges:
+            return self
+
+        return self & type(self).of(other).complement(range(self.start, self.stop))
+
+    def complement(self, within: range) -> Self:
+        """Method to get a set of points of an input `range` missing in a set."""
+
+        gaps = list()
+        gap_start = within.start
+
+        for range_ in self & IntervalSet((within, )):
+            gaps.append(range(gap_start, range_.start))
+            gap_start = range_.stop
+
+        gaps.append(range(gap_start, within.stop))
+
+        return type(self)(gaps)
+
+    @staticmethod
+    def __normalized(ranges: Iterable[range]) -> Tuple[range]:
+        bounds = list()
+
+        for range_ in ranges:
+            if len(range_) == 0:
+                continue
+            elif abs(range_.step) == 1:
+                first, last = sorted((range_[0], range_[-1]))
+                bounds.append((first, last + 1))
+            else:
+                bounds.extend((point, point + 1) for point in range_)
+
+        bounds.sort()
+        merged_bounds = list()
+
+        for start, stop in bounds:
+            if merged_bounds and start <= merged_bounds[-1][1]:
+                merged_bounds[-1] = (
+                    merged_bounds[-1][0], max(merged_bounds[-1][1], stop)
+                )
+            else:
+                merged_bounds.append((start, stop))
+
+        return tuple(range(start, stop) for start, stop in merged_bounds)
+
+
+def _resolved_ranges_of(range_: range, *, limit: int) -> Tuple[range]:
+    return (
+        _clipped(range_, -limit, 0, shift=limit),
+        _clipped(range_, 0, limit),
+    )
+
+
+def _clipped(range_: range, start: int, stop: int, *, shift: int = 0) -> range:
+    ascending_range = range_ if range_.step > 0 else range_[::-1]
+    step = ascending_range.step
+
+    first_index = max(0, -((ascending_range.start - start) // step))
+    last_index = max(0, -((ascending_range.start - stop) // step))
+
+    clipped_range = ascending_range[first_index:last_index]
+
+    return range(
+        clipped_range.start + shift,
+        clipped_range.stop + shift,
+        clipped_range.step,
+    )
+
+
 filled = contextualizing(flag_about("filled"))
 empty = contextualizing(flag_about("empty"))
 
 
-def marked_ranges_from(
-    points: Iterable[int],
-) -> Tuple[filled[range] | empty[range]]:
+def marked_ranges_from(points: Interval) -> Tuple[filled[range] | empty[range]]:
     """
-    Function to create `ranges` from input numbers and `ranges` between them.
+    Function to create `ranges` from input points or `ranges` and `ranges`
+    between them.
     """
 
-    points = sorted(set(points))
-
     marked_ranges = list()
-    last_range_start = points[0]
 
-    for current, next_ in indexed(points, 0, 1):
-        if current + 1 == next_:
-            continue
+    for range_ in IntervalSet.of(points):
+        if marked_ranges:
+            last_stop = marked_ranges[-1].value.stop
+            marked_ranges.append(empty(range(last_stop, range_.start)))
 
-        marked_ranges.append(filled(range(last_range_start, current + 1)))
-        marked_ranges.append(empty(range(current + 1, next_)))
-        last_range_start = next_
-
-    marked_ranges.append(filled(range(last_range_start, points[-1] + 1)))
+        marked_ranges.append(filled(range_))
 
     return tuple(marked_ranges)
 
@@ -319,7 +820,7 @@ class _curried_to_interval:
 @partially
 def to_interval(
     interval: Interval | ContextualForm[empty | filled, Interval],
-    action: Callable[Tuple[V], Iterable[V]],
+    action: Callable[Sequence[V], Iterable[V]],
     values: Iterable[V],
 ) -> Tuple[V]:
     """
@@ -327,40 +828,45 @@ def to_interval(
 
     Specifies a part of an input collection that will be affected by an
     unstructured range.
+
+    Sequences (including `memoryview`) are not copied; an action gets slices of
+    them, and untouched items are taken by index.
     """
 
-    values = tuple(values)
+    context, interval = contexted(interval)
 
-    if contexted(interval).context == empty:
-        return values
+    if not isinstance(values, Sequence):
+        values = tuple(values)
 
-    points = (
-        will(map)(lambda p: len(values) + p if p < 0 else p)
-        |then>> will(tfilter)(lambda p: p < len(values))
-    )(flat(ranges_from(contexted(interval).value, limit=len(values))))
+    if context == empty:
+        return tuple(values)
 
-    if len(points) == 0:
-        return values
+    filled_ranges = IntervalSet.of(interval, limit=len(values))
 
-    if set(points) == set(range(len(values))):
+    if not filled_ranges:
+        return tuple(values)
+
+    if filled_ranges == IntervalSet((range(len(values)), )):
         return tuple(action(values))
 
-    marked_ranges = marked_ranges_from(points)
+    marked_ranges = marked_ranges_from(filled_ranges)
 
-    if min(points) > 0:
-        marked_ranges = (empty(range(0, min(points))), *marked_ranges)
+    if filled_ranges.start > 0:
+        marked_ranges = (empty(range(0, filled_ranges.start)), *marked_ranges)
 
-    if max(points) != len(values) - 1:
-        marked_ranges = (*marked_ranges, empty(range(max(points) + 1, len(values))))
+    if filled_ranges.stop < len(values):
+        marked_ranges = (
+            *marked_ranges, empty(range(filled_ranges.stop, len(values)))
+        )
 
-    return flat(
-        to_interval(
-            saving_context(len |then>> range)(marked_range),
-            action,
-            values[slice_from(marked_range.value)],
+    return tuple(chain.from_iterable(
+        (
+            action(values[slice_from(marked_range.value)])
+            if of(filled, marked_range)
+            else map(values.__getitem__, marked_range.value)
         )
         for marked_range in marked_ranges
-    )
+    ))
 
 
 def groups_in(
@@ -381,24 +887,64 @@ def groups_in(
     return group_by_id
 
 
-def indexed(items: Iterable[V], *indexes: int) -> Generator[Tuple[V], None, None]:
-    """Function to get ordered items under input indexes."""
+def indexed(
+    items: Iterable[V],
+    *indexes: int,
+    step: int = 1,
+    batch: Optional[int] = None,
+) -> Generator[Tuple[V] | Tuple[Tuple[V]], None, None]:
+    """
+    Function to lazily get ordered items under input indexes.
 
-    items = tuple(items)
+    Keeps only a window of items required by the largest index, so it can be
+    used with unbounded iterators.
+
+    Windows start every `step` items. When a `batch` is passed, yields tuples
+    of up to `batch` windows instead of single windows.
+    """
 
     if any(index < 0 for index in indexes):
         raise IndexingError("indexes must be positive")
 
-    if len(items) - max(indexes) < 0:
+    if step < 1:
+        raise IndexingError("step must be positive")
+
+    if batch is not None and batch < 1:
+        raise IndexingError("batch must be positive")
+
+    windows = _windows_of(items, indexes, step=step)
+
+    if batch is None:
+        yield from windows
+        return
+
+    while window_batch := tuple(islice(windows, batch)):
+        yield window_batch
+
+
+def _windows_of(
+    items: Iterable[V],
+    indexes: Tuple[int],
+    *,
+    step: int,
+) -> Generator[Tuple[V], None, None]:
+    window = deque(maxlen=max(indexes) + 1)
+    item_number = 0
+
+    for item in items:
+        window.append(item)
+        item_number += 1
+
+        window_start = item_number - window.maxlen
+
+        if window_start >= 0 and window_start % step == 0:
+            yield tuple(window[index] for index in indexes)
+
+    if item_number < max(indexes):
         raise IndexingError(
             f"there must be {max(indexes)} or more items to index",
         )
 
-    index_border = len(items) - max(indexes)
-
-    for current_index in range(index_border):
-        yield tuple(items[current_index + index] for index in indexes)
-
 
 @val
 class table:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from functools import cached_property, reduce, wraps
+from functools import wraps
 from itertools import count
 from operator import attrgetter
 from typing import (
@@ -19,7 +19,7 @@ from act.monads import bad, left
 from act.objects import type, val, ActionOf
 from act.parameter_slicing import take
 from act.partiality import partial, partially, will, rwill
-from act.pipeline import ActionChain, then, frm, fbind_by
+from act.pipeline import ActionChain, then, fbind_by
 from act.structures import tfilter, tmap, table
 from act.tools import _get
 
@@ -324,6 +324,44 @@ class rollbackable:
     either = transaction_mode_of(of(left))
 
 
+class _TransactionOperationLog:
+    """
+    Append-only log of operations accepted by a network of transaction
+    cursors in the order of their acceptance, indexed by operation identity.
+    """
+
+    def __init__(self) -> None:
+        self._operations = list()
+        self._index_by_operation_id = dict()
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def __iter__(self) -> Iterator[Callable]:
+        return iter(self._operations)
+
+    def __contains__(self, operation: Any) -> bool:
+        return id(operation) in self._index_by_operation_id
+
+    def append(self, operation: Callable) -> int:
+        index = len(self._operations)
+
+        self._operations.append(operation)
+        self._index_by_operation_id[id(operation)] = index
+
+        return index
+
+    def view_of(self, indexes: Iterable[int]) -> tuple[Callable]:
+        return tuple(self._operations[index] for index in indexes)
+
+    def rollback(self) -> tuple[B]:
+        return tuple(
+            operation.rollback()
+            for operation in reversed(self._operations)
+            if isinstance(operation, Rollbackable[[], Any])
+        )
+
+
 class _TransactionCursor:
     ModeT: ClassVar[TypeAlias] = Callable[Callable[Pm, R], ActionT]
     HasRollbackableVersionT: ClassVar[Annotation] = type(
@@ -331,13 +369,14 @@ class _TransactionCursor:
     )
     ModeResourceT: ClassVar[TypeAlias] = HasRollbackableVersionT | ModeT
 
-    __network_operations_cache: Optional[_TransactionOperations] = None
-
     def __init__(self, *modes: ModeResourceT, _parent: Optional[Self] = None):
         self.__modes = ActionChain(map(self._mode_of, modes))
-        self.__operations = _TransactionOperations()
-        self.__parent = _parent
-        self.__childs = list()
+        self.__operation_log = (
+            _TransactionOperationLog()
+            if _parent is None
+            else _parent.network_operations
+        )
+        self.__operation_indexes = list()
 
     def _mode_of(self, mode: ModeResourceT) -> ModeT:
         if hasattr(mode, "_rollbackable_version_name"):
@@ -346,40 +385,21 @@ class _TransactionCursor:
         return mode
 
     @property
-    def network_operations(self) -> _TransactionOperations:
-        if self.__parent is not None:
-            return self.__parent.network_operations
-        elif self.__network_operations_cache is not None:
-            return self.__network_operations_cache
-        else:
-            self.__network_operations_cache = self._operations.combined_with(
-                self._child_operations,
-            )
-
-            return self.__network_operations_cache
-
-    @property(lambda s: s.__operations).setter
-    def _operations(self, operations: _TransactionOperations) -> None:
-        self.__operations = operations
-        self._clear_network_cache()
-
-    @cached_property
-    def _child_operations(self) -> _TransactionOperations:
-        if not self.__childs:
-            return _TransactionOperations()
+    def network_operations(self) -> _TransactionOperationLog:
+        return self.__operation_log
 
-        return (
-            self.__childs
-            |frm| (map |to| attrgetter("_child_operations"))
-            |frm| (reduce |to| _TransactionOperations.combined_with)
-        )
+    @property
+    def _operations(self) -> tuple[Callable]:
+        return self.__operation_log.view_of(self.__operation_indexes)
 
     def __iter__(self) -> Iterator[Self]:
         return map(self.child_for, self.__modes)
 
     def __call__(self, operation: Callable[Pm, R]) -> ActionT:
-        if not self.__is_accepted(operation):
-            self.__accept(operation)
+        if operation not in self.__operation_log:
+            self.__operation_indexes.append(
+                self.__operation_log.append(operation)
+            )
 
         return self.__modes(operation)
 
@@ -387,31 +407,7 @@ class _TransactionCursor:
         return self(_get)(value)
 
     def child_for(self, *modes: ModeT) -> Self:
-        child = type(self)(*modes, _parent=self)
-
-        self._adopt(child)
-
-        return child
-
-    def _adopt(self, child: Self) -> None:
-        self.__childs.append(child)
-        self._clear_network_cache()
-
-    def _clear_network_cache(self) -> None:
-        self.__dict__.pop("_child_operations", None)
-        self.__network_operations_cache = None
-
-        if self.__parent is not None:
-            self.__parent._clear_network_cache()
-
-    def __accept(self, operation: Callable[Pm, R]) -> None:
-        operations_to_combine = _TransactionOperations([operation])
-        self._operations = self._operations.combined_with(
-            operations_to_combine,
-        )
-
-    def __is_accepted(self, operation: Callable[Pm, R]) -> bool:
-        return operation in self.network_operations
+        return type(self)(*modes, _parent=self)
 
 
 Do: TypeAlias = _TransactionCursor
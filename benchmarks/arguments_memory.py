@@ -0,0 +1,53 @@
+"""
+Benchmark of memory per stored `act.arguments.Arguments` record.
+
+Stores a million records of calls with two positional and one keyword
+argument, as `act.transactions` does for every rollbackable call.
+
+Run from the repository root with `python -m benchmarks.arguments_memory`.
+"""
+
+from time import perf_counter
+from tracemalloc import start, stop, get_traced_memory
+from typing import Callable, Any
+
+from act.arguments import Arguments
+
+
+_NUMBER: int = 1_000_000
+
+
+def _stored(*args, **kwargs) -> Arguments:
+    return Arguments(args, kwargs)
+
+
+def _report(name: str, create: Callable[[Any], Any]) -> None:
+    value = object()
+
+    started_at = perf_counter()
+    records = [create(value) for _ in range(_NUMBER)]
+    seconds = perf_counter() - started_at
+
+    del records
+
+    start()
+    records = [create(value) for _ in range(_NUMBER)]
+    memory, _ = get_traced_memory()
+    stop()
+
+    del records
+
+    print(
+        f"{name:<32} {memory / _NUMBER:8.1f} B per record"
+        f" {seconds / _NUMBER * 1e6:8.2f} us per construction"
+    )
+
+
+def main() -> None:
+    _report("tuple and dict", lambda value: ((value, value), dict(key=value)))
+    _report("Arguments", lambda value: _stored(value, value, key=value))
+    _report("Arguments without keywords", lambda value: _stored(value, value))
+
+
+if __name__ == "__main__":
+    main()
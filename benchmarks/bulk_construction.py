@@ -0,0 +1,36 @@
+"""
+Benchmark of constructing records with `act.objects.obj` one by one and with
+`obj.many`.
+
+Run from the repository root with `python -m benchmarks.bulk_construction`.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.objects import obj
+
+
+_RECORD_NUMBER: int = 20_000
+_REPETITIONS: int = 5
+
+
+def _report(name: str, construct: Callable[[], Any]) -> None:
+    seconds = min(repeat(construct, number=1, repeat=_REPETITIONS))
+
+    print(f"{name:<40} {seconds / _RECORD_NUMBER * 1e6:8.2f} us per record")
+
+
+def main() -> None:
+    rows = [dict(id=index, name=str(index), score=index / 2) for index in range(
+        _RECORD_NUMBER
+    )]
+
+    _report("obj(row)", lambda: [obj(row) for row in rows])
+    _report("obj.many(rows)", lambda: obj.many(rows))
+    _report("obj(row, active=True)", lambda: [obj(row, active=True) for row in rows])
+    _report("obj.many(rows, active=True)", lambda: obj.many(rows, active=True))
+
+
+if __name__ == "__main__":
+    main()
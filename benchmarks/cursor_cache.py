@@ -0,0 +1,43 @@
+"""
+Benchmark of building action cursor expressions per request and calling them
+once, as a filter built from a query would be.
+
+Run from the repository root with `python -m benchmarks.cursor_cache`.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.cursors.dynamic import a, b
+
+
+_NUMBER: int = 200
+
+
+class _Item:
+    def __init__(self, price: int, discount: float) -> None:
+        self.price = price
+        self.discount = discount
+
+
+def _report(name: str, build_and_call: Callable[[], Any]) -> None:
+    seconds = min(repeat(build_and_call, number=_NUMBER, repeat=5))
+
+    print(f"{name:<44} {seconds / _NUMBER * 1e6:8.1f} us per request")
+
+
+def main() -> None:
+    item = _Item(100, 0.25)
+
+    _report(
+        "(a.price * (1 - a.discount) > b)(...)",
+        lambda: (a.price * (1 - a.discount) > b)(item, 50),
+    )
+    _report(
+        "((a.price + b) % 7 == 0)(...)",
+        lambda: ((a.price + b) % 7 == 0)(item, 5),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Benchmark of building action cursor expressions.
+
+Run from the repository root with `python -m benchmarks.cursor_construction`.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.cursors.dynamic import a, b, c, _
+
+
+_NUMBER: int = 200
+
+
+def _report(name: str, build: Callable[[], Any]) -> None:
+    seconds = min(repeat(build, number=_NUMBER, repeat=5))
+
+    print(f"{name:<40} {seconds / _NUMBER * 1e6:8.1f} us per build")
+
+
+def main() -> None:
+    _report("(a + b) * c.x", lambda: (a + b) * c.x)
+    _report("a.items_[0].price * a.qty", lambda: a.items_[0].price * a.qty)
+    _report("_.max(a, b + 1)", lambda: _.max(a, b + 1))
+    _report("a.x.y.z.set(b)", lambda: a.x.y.z.set(b))
+    _report("-(a ** 2) + (b // 3) - c[1, 2]", lambda: -(a ** 2) + (b // 3) - c[1, 2])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of calls to action cursors against handwritten equivalents.
+
+Run from the repository root with `python -m benchmarks.cursors`.
+"""
+
+from functools import partial
+from timeit import repeat
+from typing import Callable, Any
+
+from act.cursors.dynamic import a, b, c, _, fn, same
+
+
+_NUMBER: int = 10_000
+
+
+class _Point:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+class _Order:
+    def __init__(self, *prices: int) -> None:
+        self.prices = prices
+
+    @property
+    def total(self) -> int:
+        return sum(self.prices)
+
+
+def _report(name: str, call: Callable[[], Any]) -> None:
+    seconds = min(repeat(call, number=_NUMBER, repeat=5))
+
+    print(f"{name:<32} {seconds / _NUMBER * 1e9:8.1f} ns per call")
+
+
+def main() -> None:
+    point = _Point(4)
+    order = _Order(*range(200))
+
+    arithmetic = (a + b) * c.x
+    handwritten_arithmetic = lambda a, b, c: (a + b) * c.x  # noqa: E731
+    bound_arithmetic = fn(a, b, c)(arithmetic)
+    comparison = (a[0] > b) & (a[1] < b)
+    handwritten_comparison = lambda a, b: (a[0] > b) & (a[1] < b)  # noqa: E731
+    shared = a.total * a.total + a.total
+    handwritten_shared = lambda a: a.total * a.total + a.total  # noqa: E731
+    calling = _.max(a, b + 1)
+    handwritten_calling = lambda a, b: max(a, b + 1)  # noqa: E731
+    constant = same(3) * 4 + a
+    handwritten_constant = lambda a: 3 * 4 + a  # noqa: E731
+    partially_applied = (a - b)(10)
+    handwritten_partially_applied = partial(lambda a, b: a - b, 10)
+
+    _report("(a + b) * c.x", lambda: arithmetic(1, 2, point))
+    _report("handwritten", lambda: handwritten_arithmetic(1, 2, point))
+    _report("fn(a, b, c)(...)", lambda: bound_arithmetic(1, 2, point))
+    _report("(a[0] > b) & (a[1] < b)", lambda: comparison((3, 1), 2))
+    _report("handwritten", lambda: handwritten_comparison((3, 1), 2))
+    _report("a.total * a.total + a.total", lambda: shared(order))
+    _report("handwritten", lambda: handwritten_shared(order))
+    _report("_.max(a, b + 1)", lambda: calling(1, 2))
+    _report("handwritten", lambda: handwritten_calling(1, 2))
+    _report("same(3) * 4 + a", lambda: constant(1))
+    _report("handwritten", lambda: handwritten_constant(1))
+    _report("(a - b)(10)", lambda: partially_applied(1))
+    _report("handwritten", lambda: handwritten_partially_applied(1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark of evaluating action cursors over columns of a million rows.
+
+Run from the repository root with `python -m benchmarks.cursors_over_columns`.
+NumPy columns are measured only when NumPy is installed.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.cursors.dynamic import a, b
+
+
+_ROWS: int = 1_000_000
+
+
+def _report(name: str, evaluate: Callable[[], Any]) -> None:
+    seconds = min(repeat(evaluate, number=1, repeat=3))
+
+    print(f"{name:<32} {seconds * 1e3:8.1f} ms per {_ROWS} rows")
+
+
+def main() -> None:
+    cursor = a * 2 + b
+    first_column = list(range(_ROWS))
+    second_column = list(range(_ROWS, 0, -1))
+
+    _report("row by row", lambda: list(map(cursor, first_column, second_column)))
+    _report("over lists", lambda: cursor.over(a=first_column, b=second_column))
+    _report("handwritten comprehension", lambda: [
+        a * 2 + b for a, b in zip(first_column, second_column)
+    ])
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    first_array = numpy.array(first_column)
+    second_array = numpy.array(second_column)
+
+    _report("over arrays", lambda: cursor.over(a=first_array, b=second_array))
+    _report("handwritten arrays", lambda: first_array * 2 + second_array)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of `act.structures.frozendict` against copying of `dict`s.
+
+Run from the repository root with `python -m benchmarks.frozendict`.
+"""
+
+from timeit import timeit
+
+from act.arguments import Arguments
+from act.structures import frozendict
+
+
+def _updating_by_copying(table: dict, keys: range) -> dict:
+    for key in keys:
+        table = table | {key: key}
+
+    return table
+
+
+def _updating_persistently(mapping: frozendict, keys: range) -> frozendict:
+    for key in keys:
+        mapping = mapping.set(key, key)
+
+    return mapping
+
+
+def _report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<48} {seconds / number * 1e6:10.2f} us")
+
+
+def main() -> None:
+    for size in (8, 100, 1_000, 10_000):
+        table = {key: key for key in range(size)}
+        mapping = frozendict(table)
+        updates = range(size, size + 100)
+
+        print(f"100 single updates of a mapping with {size} items")
+        _report(
+            "dict copying",
+            timeit(lambda: _updating_by_copying(table, updates), number=20),
+            20,
+        )
+        _report(
+            "frozendict.set",
+            timeit(lambda: _updating_persistently(mapping, updates), number=20),
+            20,
+        )
+
+    print("Merging of arguments with 4 + 4 keyword arguments")
+    first = Arguments(kwargs=dict(a=1, b=2, c=3, d=4))
+    second = Arguments(kwargs=dict(e=5, f=6, g=7, h=8))
+    _report(
+        "dict merging",
+        timeit(lambda: dict(first.kwargs) | dict(second.kwargs), number=50_000),
+        50_000,
+    )
+    _report(
+        "Arguments.expanded_with",
+        timeit(lambda: first.expanded_with(second), number=50_000),
+        50_000,
+    )
+
+    print("Reading of 4 keyword arguments")
+    table = dict(a=1, b=2, c=3, d=4)
+    mapping = frozendict(table)
+    _report("dict", timeit(lambda: table["c"], number=500_000), 500_000)
+    _report("frozendict", timeit(lambda: mapping["c"], number=500_000), 500_000)
+
+
+if __name__ == "__main__":
+    main()
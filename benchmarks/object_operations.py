@@ -0,0 +1,71 @@
+"""
+Benchmark of copying operations of `act.objects` and of its test workload.
+
+CPython does not count allocations, so this reports time and the peak of
+traced memory. Run from the repository root with
+`python -m benchmarks.object_operations`.
+"""
+
+from copy import copy
+from inspect import getmembers
+from time import perf_counter
+from timeit import timeit
+from tracemalloc import start, stop, get_traced_memory
+from typing import Callable, Any
+
+from act.objects import val, expand, like
+from tests import test_objects
+
+
+_NUMBER: int = 20_000
+
+
+def _report(name: str, action: Callable[[], Any]) -> None:
+    seconds = timeit(action, number=_NUMBER)
+
+    start()
+    for _ in range(100):
+        action()
+    _, peak = get_traced_memory()
+    stop()
+
+    print(
+        f"{name:<28} {seconds / _NUMBER * 1e6:8.2f} us"
+        f" {peak / 1024:8.1f} KiB traced peak of 100 runs"
+    )
+
+
+def _run_object_tests() -> None:
+    for _, test in getmembers(test_objects):
+        if hasattr(test, "__code__") and test.__name__.startswith("test_"):
+            if test.__code__.co_argcount == 0:
+                test()
+        elif isinstance(test, type) and test.__name__.startswith("Test"):
+            for name, method in getmembers(test):
+                if name.startswith("test_"):
+                    method(test(name))
+
+
+def main() -> None:
+    record = val(a=1, b=2, c=3, d=4, e=5, f=6)
+    other = val(a=1, b=2, c=3, d=4, e=5, f=6)
+
+    _report("copy", lambda: copy(record))
+    _report("+ of a present attribute", lambda: record + "a")
+    _report("+ of a new attribute", lambda: record + "g")
+    _report("- of an attribute", lambda: record - "a")
+    _report("&", lambda: record & other)
+    _report("==", lambda: record == other)
+    _report("like", lambda: like(record, other))
+    _report("expand", lambda: expand(record, dict(g=7)))
+
+    started_at = perf_counter()
+
+    for _ in range(20):
+        _run_object_tests()
+
+    print(f"{'tests.test_objects x20':<28} {perf_counter() - started_at:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of `act.scoping.value_in` and vargetting cursors at several stack
+depths.
+
+Run from the repository root with `python -m benchmarks.scoping`.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.cursors.dynamic import _
+from act.scoping import value_in
+
+
+_NUMBER: int = 200
+_DEPTHS: tuple[int, ...] = (1, 10, 100, 500)
+
+
+def _at_depth(depth: int, action: Callable[[], Any]) -> Any:
+    return action() if depth <= 1 else _at_depth(depth - 1, action)
+
+
+def _report(name: str, depth: int, action: Callable[[], Any]) -> None:
+    seconds = min(repeat(
+        lambda: _at_depth(depth, lambda: [action() for _ in range(_NUMBER)]),
+        number=1,
+        repeat=5,
+    ))
+
+    print(f"{name:<24} depth {depth:<4} {seconds / _NUMBER * 1e6:10.1f} us per call")
+
+
+def main() -> None:
+    for depth in _DEPTHS:
+        _report("value_in global", depth, lambda: value_in("_NUMBER"))
+        _report("value_in builtin", depth, lambda: value_in("len"))
+        _report("_.len", depth, lambda: _.len)
+
+
+if __name__ == "__main__":
+    main()
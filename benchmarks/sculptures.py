@@ -0,0 +1,65 @@
+"""
+Benchmark of creating `act.objects.sculpture_of` proxies and accessing
+attributes through them.
+
+Run from the repository root with `python -m benchmarks.sculptures`.
+"""
+
+from timeit import timeit
+
+from act.objects import sculpture_of
+
+
+_NUMBER: int = 200_000
+_CREATION_NUMBER: int = 20_000
+
+
+class _Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    @property
+    def norm(self) -> int:
+        return abs(self.x) + abs(self.y)
+
+
+def _report(name: str, seconds: float, number: int = _NUMBER) -> None:
+    print(f"{name:<40} {seconds / number * 1e9:8.1f} ns per operation")
+
+
+def main() -> None:
+    points = [_Point(index, -index) for index in range(_CREATION_NUMBER)]
+    point = points[0]
+
+    sculpture = sculpture_of(point, first='x', norm=_Point.norm)
+
+    _report("read of a named attribute", timeit(
+        lambda: sculpture.first, number=_NUMBER
+    ))
+    _report("read of a proxied property", timeit(
+        lambda: sculpture.norm, number=_NUMBER
+    ))
+    _report("read of another attribute", timeit(
+        lambda: sculpture.y, number=_NUMBER
+    ))
+    _report("write of a named attribute", timeit(
+        lambda: setattr(sculpture, "first", 1), number=_NUMBER
+    ))
+    _report("write of another attribute", timeit(
+        lambda: setattr(sculpture, "y", 1), number=_NUMBER
+    ))
+
+    iterated_points = iter(points)
+    _report(
+        "creation",
+        timeit(
+            lambda: sculpture_of(next(iterated_points), first='x', norm=_Point.norm),
+            number=_CREATION_NUMBER,
+        ),
+        _CREATION_NUMBER,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark of calls through `act.parameter_slicing.take` against direct calls.
+
+Run from the repository root with `python -m benchmarks.take`.
+"""
+
+from timeit import repeat
+from typing import Callable, Any
+
+from act.parameter_slicing import take
+
+
+_NUMBER: int = 200_000
+
+
+def _action(*args, **kwargs) -> None:
+    ...
+
+
+def _report(name: str, call: Callable[[], Any]) -> None:
+    seconds = min(repeat(call, number=_NUMBER, repeat=5))
+
+    print(f"{name:<32} {seconds / _NUMBER * 1e9:8.1f} ns per call")
+
+
+def main() -> None:
+    by_position = take[1](_action)
+    by_positions = take[0, 2](_action)
+    by_slice = take[1:](_action)
+    by_position_and_slice = take[0, 2:](_action)
+    by_keyword = take[0]['b'](_action)
+
+    _report("direct", lambda: _action(1, 2, 3))
+    _report("take[1]", lambda: by_position(1, 2, 3))
+    _report("take[0, 2]", lambda: by_positions(1, 2, 3))
+    _report("take[1:]", lambda: by_slice(1, 2, 3))
+    _report("take[0, 2:]", lambda: by_position_and_slice(1, 2, 3))
+    _report("take[0]['b'] with keywords", lambda: by_keyword(1, a=2, b=3))
+
+
+if __name__ == "__main__":
+    main()
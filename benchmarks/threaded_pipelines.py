@@ -0,0 +1,74 @@
+"""
+Multi-threaded stress benchmark of pipelines, partially applied functions
+and `once` shared between threads from their first use.
+
+Run from the repository root with `python -m benchmarks.threaded_pipelines`.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from threading import Barrier
+from time import perf_counter
+
+from act.data_flow import once
+from act.partiality import partially
+from act.pipeline import ActionChain
+
+
+_THREAD_NUMBER: int = 8
+_ROUND_NUMBER: int = 300
+_CALL_NUMBER: int = 50
+
+
+def _round(barrier: Barrier) -> int:
+    """Function to run one round of shared objects and count its errors."""
+
+    calls = count()
+
+    chain = ActionChain((lambda v, step=step: v + step) for step in range(16))
+    add = partially(lambda a, b, c: a + b + c)
+    value = once(lambda: (next(calls), sum(range(20_000)), 42)[-1])
+
+    def use() -> int:
+        barrier.wait()
+        errors = 0
+
+        for index in range(_CALL_NUMBER):
+            try:
+                errors += value() != 42
+                errors += chain(index) != index + 120
+                errors += add(index)(1)(2) != index + 3
+            except Exception:
+                errors += 1
+
+        return errors
+
+    with ThreadPoolExecutor(_THREAD_NUMBER) as executor:
+        errors = sum(executor.map(
+            lambda _: use(), range(_THREAD_NUMBER)
+        ))
+
+    return errors + (next(calls) != 1)
+
+
+def main() -> None:
+    sys.setswitchinterval(1e-6)
+
+    barrier = Barrier(_THREAD_NUMBER)
+    errors = 0
+
+    started_at = perf_counter()
+
+    for _ in range(_ROUND_NUMBER):
+        errors += _round(barrier)
+
+    seconds = perf_counter() - started_at
+
+    print(f"{_THREAD_NUMBER} threads, {_ROUND_NUMBER} rounds of shared objects")
+    print(f"errors: {errors}")
+    print(f"{seconds / _ROUND_NUMBER * 1e3:.2f} ms per round")
+
+
+if __name__ == "__main__":
+    main()
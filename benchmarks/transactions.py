@@ -0,0 +1,52 @@
+"""
+Benchmark of transaction cursors accepting many distinct operations, without
+modes to measure their bookkeeping and with a mode as in `do` blocks.
+
+Run from the repository root with `python -m benchmarks.transactions`.
+"""
+
+from functools import partial
+from timeit import repeat
+
+from act.transactions import do, rollbackable, Do
+
+
+class _Operation:
+    def __call__(self, value: int) -> int:
+        return value
+
+    def rollback(self) -> None:
+        return None
+
+
+def _accept_all(cursor: Do, operations: list[_Operation]) -> None:
+    child, = cursor
+
+    for index, operation in enumerate(operations):
+        (cursor if index % 2 else child)(operation)(index)
+
+
+def _report(name: str, number_of_operations: int, is_in_do: bool) -> None:
+    operations = [_Operation() for _ in range(number_of_operations)]
+
+    if is_in_do:
+        run = partial(do(rollbackable.optionally)(_accept_all), operations)
+    else:
+        def run() -> None:
+            _accept_all(Do(lambda operation: operation), operations)
+
+    seconds = min(repeat(run, number=1, repeat=3))
+
+    print(f"{name:<6} {number_of_operations:>6} operations {seconds * 1e3:8.1f} ms")
+
+
+def main() -> None:
+    for number_of_operations in (1_000, 3_000, 10_000):
+        _report("cursor", number_of_operations, is_in_do=False)
+
+    for number_of_operations in (1_000, 3_000):
+        _report("do", number_of_operations, is_in_do=True)
+
+
+if __name__ == "__main__":
+    main()
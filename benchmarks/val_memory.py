@@ -0,0 +1,57 @@
+"""
+Benchmark of memory per `act.objects.val` record with the same field set.
+
+Run from the repository root with `python -m benchmarks.val_memory`.
+"""
+
+from dataclasses import dataclass
+from time import perf_counter
+from tracemalloc import start, stop, get_traced_memory
+from types import SimpleNamespace
+from typing import Callable, Any
+
+from act.objects import val, obj, struct
+
+
+_NUMBER: int = 20_000
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+    z: int
+
+
+def _report(name: str, create: Callable[int, Any]) -> None:
+    started_at = perf_counter()
+    records = [create(index) for index in range(_NUMBER)]
+    seconds = perf_counter() - started_at
+
+    del records
+
+    start()
+    records = [create(index) for index in range(_NUMBER)]
+    memory, _ = get_traced_memory()
+    stop()
+
+    del records
+
+    print(
+        f"{name:<24} {memory / _NUMBER:8.1f} B per record"
+        f" {seconds / _NUMBER * 1e6:8.2f} us per construction"
+    )
+
+
+def main() -> None:
+    point = struct(_Point)
+
+    _report("SimpleNamespace", lambda i: SimpleNamespace(x=i, y=i, z=i))
+    _report("dict", lambda i: dict(x=i, y=i, z=i))
+    _report("val", lambda i: val(x=i, y=i, z=i))
+    _report("obj", lambda i: obj(x=i, y=i, z=i))
+    _report("struct", lambda i: point(i, i, i))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark of attribute reads of `act.objects.val` against `SimpleNamespace`.
+
+Run from the repository root with `python -m benchmarks.val_reads`.
+"""
+
+from timeit import timeit
+from types import SimpleNamespace
+
+from act.objects import val, as_method
+
+
+_NUMBER: int = 1_000_000
+
+
+def _report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / _NUMBER * 1e9:8.1f} ns per read")
+
+
+def main() -> None:
+    namespace = SimpleNamespace(a=1, b=2, c=3)
+    plain_val = val(a=1, b=2, c=3)
+    val_with_method = val(a=1, b=2, c=3, method=as_method(lambda o: o.a))
+
+    _report("SimpleNamespace", timeit(lambda: namespace.b, number=_NUMBER))
+    _report("val", timeit(lambda: plain_val.b, number=_NUMBER))
+    _report(
+        "val with a method, plain attribute",
+        timeit(lambda: val_with_method.b, number=_NUMBER),
+    )
+    _report(
+        "val with a method, method",
+        timeit(lambda: val_with_method.method, number=_NUMBER),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
+from pickle import dumps, loads
 from typing import Iterable, Callable, Any
 
-from pytest import mark
+from pytest import mark, raises
 
 from act.arguments import *
+from act.structures import frozendict
 from act.testing import case_of
 
 
@@ -111,6 +113,78 @@ test_argument_pack_only_with = case_of(
 )
 
 
+test_argument_pack_without = case_of(
+    (
+        lambda: Arguments((1, 2, 3), dict(a=4)).without(ArgumentKey(1)),
+        Arguments((1, 3), dict(a=4)),
+    ),
+    (
+        lambda: Arguments((1, 2, 3), dict(a=4, b=5)).without(2, 5),
+        Arguments((1, 3), dict(a=4)),
+    ),
+    (
+        lambda: Arguments(([1], 2), dict(a=4)).without(
+            [1],
+            ArgumentKey('a', is_keyword=True),
+        ),
+        Arguments((2, )),
+    ),
+    (
+        lambda: Arguments((1, 2), dict(a=3)).without(),
+        Arguments((1, 2), dict(a=3)),
+    ),
+)
+
+
+test_argument_pack_only_with_values = case_of(
+    (
+        lambda: Arguments((1, 2, 3), dict(a=4, b=5)).only_with(5, 3),
+        Arguments((3, ), dict(b=5)),
+    ),
+    (
+        lambda: Arguments(([1], 2), dict(a=[3])).only_with([3], [1]),
+        Arguments(([1], ), dict(a=[3])),
+    ),
+    (
+        lambda: Arguments((1, 2)).only_with(ArgumentKey(4, default=8)),
+        Arguments((8, )),
+    ),
+)
+
+
+test_argument_pack_len = case_of(
+    (lambda: len(Arguments((1, 2), dict(a=3))), 3),
+    (lambda: len(Arguments()), 0),
+)
+
+
+def test_argument_pack_storing():
+    kwargs = dict(a=3)
+    arguments = Arguments([1, 2], kwargs)
+
+    kwargs["b"] = 4
+
+    assert arguments == Arguments((1, 2), dict(a=3))
+    assert loads(dumps(arguments)) == arguments
+    assert not hasattr(arguments, "__dict__")
+
+
+def test_argument_pack_keywords():
+    arguments = Arguments([1], dict(a=2))
+
+    assert arguments.kwargs is arguments.kwargs
+    assert arguments.kwargs == frozendict(a=2)
+
+    empty_arguments = Arguments()
+
+    with raises(TypeError):
+        empty_arguments._kwargs["a"] = 1
+
+    assert empty_arguments.kwargs == frozendict()
+    assert (empty_arguments | arguments) == arguments
+    assert loads(dumps(empty_arguments)) == Arguments()
+
+
 test_arguments_unpacking = case_of(
     (lambda: (lambda a, b, c=0: a / b + c)(*Arguments([16, 2])), 8),
     (lambda: (lambda a, b, c=0: a / b + c)(*Arguments([16, 2], dict(d=8))), 8),
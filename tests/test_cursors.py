@@ -1,11 +1,17 @@
 from functools import reduce
+from inspect import signature
+from threading import Thread
+from types import SimpleNamespace
 import operator
 
+from act.contexting import contextual
+from act.cursors import cache_info, cache_clear
 from act.cursors.dynamic import *
+from act.errors import ActionCursorError
 from act.testing import case_of
 from tests.mocks import MockA, MockB
 
-from pytest import mark
+from pytest import mark, raises, importorskip
 
 
 test_single_cursor = case_of((
@@ -130,6 +136,9 @@ test_cursors_with_attr_getting = case_of(
     (lambda: (v.a[w - 1])(MockA([1, 2, 3]), -1), 2),
     (lambda: (v.a._(5))(MockA(lambda a: a + 3)), 8),
     (lambda: (2 * v.a._(5) + 16)(MockA(lambda a: a + 3)), 32),
+    (lambda: (v.keys_)(SimpleNamespace(keys=8)), 8),
+    (lambda: (v.keys__)(SimpleNamespace(keys_=8)), 8),
+    (lambda: (v.keysx)(SimpleNamespace(keysx=8)), 8),
 )
 
 
@@ -294,10 +303,268 @@ test_cursot_partiality = case_of(
     (lambda: (v / w + x)(10)(2)(3), 8),
     (lambda: (v / w + x)(10, 2)(3), 8),
     (lambda: (v / w + x)(10)(2, 3), 8),
+    (lambda: list(map((v - w)(10), [1, 2, 3])), [9, 8, 7]),
+    (lambda: sorted([3, 1, 2], key=(v - w)(0)), [3, 2, 1]),
+    (lambda: (v + kwargs['k'] + kwargs['m'])(m=1)(2, k=3), 6),
+    (lambda: _(v, w, *args)(1)(2, 3, 4), (1, 2, 3, 4)),
 )
 
 
+def test_cursor_partiality_reuse():
+    cursor = (v + w)(1)
+
+    assert cursor(2) == 3
+    assert cursor(3) == 4
+
+    with raises(ActionCursorError):
+        cursor(2, 3)
+
+
 test_same = case_of(
     lambda: (same(4).in_([1, 2, 4]))(),
     lambda: (same(4).not_in(list()))(),
 )
+
+
+test_compiled_cursors = case_of(
+    (lambda: ((v + w) * x.a)(1, 2, MockA(3)), 9),
+    (lambda: (kwargs['v'] + v)(1, v=2), 3),
+    (lambda: (v + args[0] + kwargs['w'])(1, 2, 3, w=4), 7),
+    (lambda: _.reduce(operator.add, _(v, *args))(0, 1, 2), 3),
+    (lambda: (-v.a ** 2 // w)(MockA(3), 2), -5),
+    (lambda: (v == w).is_not(v != w)(1, 1), True),
+    (lambda: (v[w] < 4)([3, 5], 0), True),
+    (lambda: (v.has(w) & w.in_([1]))([1], 1), True),
+    (lambda: reduce(operator.add, range(1100), v)(0), 604450),
+)
+
+
+test_cursor_reprs = case_of(
+    (lambda: repr((v + w) * x.a), "(λv, w, x: (v + w) * x.a)"),
+    (
+        lambda: repr(-v ** 2 + w // 3 - x[1, 2]),
+        "(λv, w, x: -v ** 2 + w // 3 - x[1, 2])",
+    ),
+    (lambda: repr(v - w - (x - 1)), "(λv, w, x: v - w - (x - 1))"),
+    (lambda: repr(v.a.set(w)), "(λv, w: (v.a <- w))"),
+    (lambda: repr(v[w].iobe(len)), "(λv, w: (v[w] = len(v[w])))"),
+    (
+        lambda: repr(v._(1, *w, k=x, **kwargs)),
+        "(λv, w, x, **kwargs: v(1, *w, k=x, **kwargs))",
+    ),
+    (lambda: repr(_(v, w)), "(λv, w: (v, w))"),
+    (lambda: repr(4 + v), "(λv: 4 + v)"),
+)
+
+
+class _MockReading:
+    def __init__(self, value: int):
+        self.reads = 0
+        self._value = value
+
+    @property
+    def value(self) -> int:
+        self.reads += 1
+        return self._value
+
+    def touch(self) -> int:
+        return 0
+
+
+def test_cursor_common_subexpressions():
+    object_ = _MockReading(3)
+
+    assert (v.value * v.value + v.value)(object_) == 12
+    assert object_.reads == 1
+
+    assert (v.value + v.touch._() + v.value)(object_) == 6
+    assert object_.reads == 3
+
+
+def test_cursor_common_subexpressions_after_setting():
+    assert (v.a.ioset(v.a + 1).a + v.a)(MockA(1)) == 4
+
+
+def _interpreted(cursor, *args):
+    names = (parameter.name for parameter in cursor._regular_parameters)
+
+    return cursor._actions(contextual(dict(zip(names, args)), None)).value
+
+
+@mark.parametrize(
+    "cursor, args",
+    [
+        (same(3) * 4 + v, (1, )),
+        (same(3) * same(4) + same(1) / same(2), tuple()),
+        (same((1, 2))[0] * v, (5, )),
+        (same("abc").upper._() + v, ("d", )),
+        (same(operator.not_)._(same(operator.not_)._(v.has(w))), ([1], 1)),
+        (same(operator.not_)._(same(operator.not_)._(v)), ([1], )),
+        (same(len)._(v) + 0, ([1, 2], )),
+        (1 * (same(len)._(v) - 0) // 1, ([1, 2], )),
+        (v + 0, (True, )),
+        (v * 1, (-0.0, )),
+        (-(-v), (True, )),
+        (~(~same(len)._(v)), ([1], )),
+        (+v.is_(w), (None, None)),
+        (same(True) + 0, tuple()),
+        (same(-0.0) + 0, tuple()),
+        (same(4) // same(0) + v, (1, )),
+    ],
+)
+def test_simplified_cursors(cursor, args):
+    try:
+        interpreted_result = _interpreted(cursor, *args)
+    except Exception as error:
+        with raises(type(error)):
+            cursor(*args)
+    else:
+        result = cursor(*args)
+
+        assert type(result) is type(interpreted_result)
+        assert result == interpreted_result
+        assert repr(result) == repr(interpreted_result)
+
+
+def test_simplified_cursors_with_mutable_values():
+    values = [1]
+    cursor = same(values)[0] + v
+
+    assert cursor(1) == 2
+
+    values[0] = 4
+
+    assert cursor(1) == 5
+
+
+def test_cursor_cache():
+    cache_clear()
+
+    assert ((v + w) * 3)(1, 2) == 9
+    assert ((v + w) * 3)(2, 3) == 15
+    assert cache_info()[:2] == (1, 1)
+
+    assert ((v + w) * 4)(1, 2) == 12
+    assert ((v + w) * True)(1, 2) == 3
+    assert ((v - w) * 3)(1, 2) == -3
+    assert cache_info()[:2] == (1, 4)
+
+    assert (same([1])[0] + v)(1) == 2
+    assert (same([2])[0] + v)(1) == 3
+    assert cache_info()[:2] == (1, 6)
+
+    cache_clear()
+
+    assert cache_info() == (0, 0, cache_info().maxsize, 0)
+
+
+def test_cursor_cache_in_threads():
+    cache_clear()
+
+    def run() -> None:
+        for number in range(200):
+            assert (v * (number % 20) + w)(1, 1) == number % 20 + 1
+
+    threads = [Thread(target=run) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    hits, misses, _, size = cache_info()
+
+    assert hits + misses == 800
+    assert size == 20
+
+
+test_cursors_over_columns = case_of(
+    (lambda: (v * 2 + w).over(v=[1, 2, 3], w=[4, 5, 6]), [6, 9, 12]),
+    (lambda: (v[1] > w).over(v=[(0, 1), (2, 3)], w=[0, 3]), [True, False]),
+    (lambda: v.a.over(v=[MockA(1), MockA(2)]), [1, 2]),
+    (lambda: v.and_(w).over(v=[1, 0], w=[2, 3]), [2, 0]),
+    (lambda: reduce(operator.add, range(1100), v).over(v=[0, 1]), [604450, 604451]),
+    (lambda: same(4).over(), list()),
+)
+
+
+@mark.parametrize(
+    "cursor, is_nested, is_vectorized",
+    [
+        (v * 2 + w, False, True),
+        (-(v // 3) % w, False, True),
+        ((v[1] > w) | (v[0] == 2), True, True),
+        (v ** 2 - v.real * w, False, False),
+    ],
+)
+def test_cursor_over_numpy_columns(cursor, is_nested, is_vectorized):
+    numpy = importorskip("numpy")
+
+    first_column = numpy.arange(12).reshape(6, 2) if is_nested else numpy.arange(6)
+    second_column = numpy.arange(1, 7)
+
+    results = cursor.over(v=first_column, w=second_column)
+
+    assert isinstance(results, numpy.ndarray) is is_vectorized
+    assert list(results) == [
+        cursor(first, second)
+        for first, second in zip(first_column, second_column)
+    ]
+
+
+def test_deep_cursor_over_numpy_columns():
+    numpy = importorskip("numpy")
+
+    cursor = reduce(operator.add, range(3000), v)
+
+    assert list(cursor.over(v=numpy.arange(3))) == [4498500, 4498501, 4498502]
+
+
+@mark.parametrize(
+    "columns",
+    [dict(v=[1]), dict(v=[1], w=[1, 2]), dict(v=[1], w=[1], x=[1])],
+)
+def test_cursor_over_invalid_columns(columns):
+    with raises(ActionCursorError):
+        (v + w).over(**columns)
+
+
+test_fn = case_of(
+    (lambda: fn(v, w)(v + w * 2)(1, 2), 5),
+    (lambda: fn(w, v)(v - w)(1, 9), 8),
+    (lambda: fn(v, _, w)(v + w)(1, 100, 2), 3),
+    (lambda: fn(v, act, w)(v * 2)(4, None, None), 8),
+    (lambda: fn(v, args)(_(v, *args))(1, 2, 3), (1, 2, 3)),
+    (lambda: fn(v, kwargs)(kwargs['v'] + v)(1, v=2), 3),
+    (
+        lambda: fn(v, args, kwargs)(_(v, *args, *kwargs.values_._()))(1, 2, x=3),
+        (1, 2, 3),
+    ),
+    (lambda: fn(v)(reduce(operator.add, range(1100), v))(0), 604450),
+    (
+        lambda: str(signature(fn(v, _, args, kwargs)(v))),
+        "(v, _1, /, *args, **kwargs)",
+    ),
+    (lambda: str(signature(fn(kwargs)(kwargs))), "(**kwargs)"),
+)
+
+
+@mark.parametrize(
+    "get_function",
+    [
+        lambda: fn(v + 1),
+        lambda: fn(v, v),
+        lambda: fn(args, v),
+        lambda: fn(kwargs, v),
+        lambda: fn(v)(v + w),
+        lambda: fn(v)(4),
+    ],
+)
+def test_fn_with_invalid_parameters(get_function):
+    with raises(ActionCursorError):
+        get_function()
+
+
+def test_fn_without_currying():
+    with raises(TypeError):
+        fn(v, w)(v + w)(1)
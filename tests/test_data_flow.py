@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from operator import truediv, add, sub
+from time import sleep
 from typing import Any, Iterable
 
 from pytest import mark, raises
@@ -80,6 +82,24 @@ def test_once():
     assert action() is None
 
 
+def test_once_in_threads():
+    calls = list()
+
+    def slow_action():
+        calls.append(None)
+        sleep(0.01)
+
+        return 42
+
+    action = once(slow_action)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = tuple(executor.map(lambda _: action(), range(8)))
+
+    assert results == (42, ) * 8
+    assert len(calls) == 1
+
+
 test_via_indexer = case_of(
     (lambda: via_indexer(lambda v: v + 3)[5], 8),
     (lambda: via_indexer(truediv)[8, 2], 4),
@@ -1,11 +1,15 @@
-from dataclasses import dataclass
+import builtins
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
 from functools import partial
 from operator import add, attrgetter
+from pickle import dumps, loads
 
 from pytest import mark, raises
 
 from act.aggregates import Access
 from act.objects import *
+from act.objects import _sculpture_types
 from act.synonyms import with_
 from act.testing import case_of
 from tests.mocks import MockA, MockB, nested
@@ -125,11 +129,188 @@ test_callable_val = case_of(
 )
 
 
+test_val_with_internally_used_names = case_of(
+    (lambda: val(_special_attr_kinds=1)._special_attr_kinds, 1),
+    (lambda: val(_shares_attributes=1)._shares_attributes, 1),
+    (lambda: copy(val(_shares_attributes=1))._shares_attributes, 1),
+    (lambda: val(_shares_attributes=1), val(_shares_attributes=1)),
+    (lambda: val(_val__special_attr_kinds=1)._val__special_attr_kinds, 1),
+    (lambda: val(a=1, _val__special_attr_kinds=1).a, 1),
+    (lambda: copy(val(_val__special_attr_kinds=1))._val__special_attr_kinds, 1),
+)
+
+
+def test_val_with_internal_slot_names():
+    name = "_val__special_attr_kinds"
+    value = val(a=1)
+
+    setattr(value, name, 2)
+
+    assert getattr(value, name) == 2
+    assert value == val(a=1, **{name: 2})
+    assert loads(dumps(value)) == value
+
+    delattr(value, name)
+
+    assert value == val(a=1)
+
+    with raises(AttributeError):
+        delattr(value, name)
+
+
 test_val_with_method = case_of(
     (lambda: val(value=5, method=as_method(lambda o, v: o.value + v)).method(3), 8)
 )
 
 
+def test_val_with_method_changing():
+    valect_ = val(value=5)
+
+    valect_.method = as_method(lambda o, v: o.value + v)
+
+    assert valect_.method(3) == 8
+    assert type(valect_) is val
+
+    valect_.method = 4
+
+    assert valect_.method == 4
+    assert val(method=as_method(lambda o: o.value), value=1).method() == 1
+    assert val(method=as_method(lambda o: o.value), value=1) - "method" == (
+        val(value=1)
+    )
+
+
+def test_vals_of_one_shape():
+    first = val(a=1, b=2)
+    second = val(a=3, b=4)
+
+    first.c = 5
+    del second.a
+
+    assert first == val(a=1, b=2, c=5)
+    assert second == val(b=4)
+    assert type(first) is type(second) is val
+    assert first & second == val(a=1, b=4, c=5)
+    assert loads(dumps(first)) == deepcopy(first) == first
+    assert val(__class__=int).__dict__ == dict(__class__=int)
+
+
+def test_hidden_val_types():
+    first = val(a=1)
+
+    assert isinstance(first, val)
+    assert type(first) is val
+    assert builtins.type(first) is not val
+    assert issubclass(builtins.type(first), val)
+    assert builtins.type(first) is builtins.type(val(a=2))
+    assert builtins.type(first).__name__ == "val"
+
+
+def test_val_copying():
+    original = val(a=1, b=2)
+    clone = copy(original)
+
+    clone.a = 3
+    original.c = 4
+
+    assert original == val(a=1, b=2, c=4)
+    assert clone == val(a=3, b=2)
+
+    del copy(original).a
+
+    assert original == val(a=1, b=2, c=4)
+    assert original + 'd' == val(a=1, b=2, c=4, d=None)
+    assert original - 'a' == val(b=2, c=4)
+    assert original == val(a=1, b=2, c=4)
+
+
+def test_val_copying_with_dict_changes():
+    original = val(a=1, b=2)
+
+    vars(copy(original))['a'] = 3
+    copy(original).__dict__.update(b=4, c=5)
+    object.__setattr__(copy(original), 'd', 6)
+
+    assert original == val(a=1, b=2)
+
+
+def test_frozenval():
+    first = frozenval(a=1, b=2)
+    second = frozenval(val(b=2), a=1)
+
+    assert first == second == val(a=1, b=2)
+    assert hash(first) == hash(second)
+    assert {first: 3}[second] == 3
+    assert len({first, second, frozenval(a=2, b=1)}) == 2
+
+    assert first + 'c' == frozenval(a=1, b=2, c=None)
+    assert first - 'a' == frozenval(b=2)
+    assert isinstance(first - 'a', frozenval)
+    assert copy(first) is first
+    assert loads(dumps(first)) == deepcopy(first) == first
+
+    with raises(AttributeError):
+        first.a = 3
+
+    with raises(AttributeError):
+        del first.a
+
+    with raises(AttributeError):
+        first.c = 3
+
+    assert first == val(a=1, b=2)
+
+
+def test_frozenval_with_method():
+    method = as_method(lambda self, b: self.a * b)
+
+    assert frozenval(a=2, method=method).method(4) == 8
+    assert hash(frozenval(method=method)) == hash(frozenval(method=method))
+
+    with raises(TypeError):
+        hash(frozenval(a=list()))
+
+
+def test_callable_frozenval():
+    first = frozenval(a=1, __call__=lambda b: b + 5)
+
+    assert first(3) == 8
+    assert not callable(frozenval(a=1))
+    assert frozenval(val(__call__=abs))(-3) == 3
+    assert (first - 'a')(3) == 8
+    assert hash(first) == hash(frozenval(a=1, __call__=first.__call__))
+
+    with raises(AttributeError):
+        first.a = 2
+
+
+test_frozenval_with_internally_used_names = case_of(
+    (lambda: frozenval(_hash=1)._hash, 1),
+    (lambda: hash(frozenval(_hash=1)) == hash(frozenval(_hash=1)), True),
+    (lambda: frozenval(_frozenval__hash=1)._frozenval__hash, 1),
+    (lambda: frozenval(_frozenval__hash=1), val(_frozenval__hash=1)),
+)
+
+
+test_dict_of_view = case_of(
+    (lambda: dict_of_view(val(a=1, b=2)), dict(a=1, b=2)),
+    (lambda: dict_of_view(dict(a=1)), dict(a=1)),
+    (lambda: dict_of_view(4), dict()),
+)
+
+
+def test_dict_of_view_changing():
+    valect_ = val(a=1)
+    view = dict_of_view(valect_)
+
+    valect_.b = 2
+
+    assert view == dict(a=1, b=2)
+
+    with raises(TypeError):
+        view['c'] = 3
+
+
 test_val_with_descriptor_getting = case_of(
     (lambda: val(a=5, b=as_descriptor(property(lambda o: o.a + 3))).b, 8),
     (lambda: val(a=5, b=as_descriptor(lambda o, v: o.a + v)).b(3), 8),
@@ -241,6 +422,43 @@ def test_recursive_like():
     assert not like(b)(a)
 
 
+def test_deep_like():
+    first = MockA(1)
+    second = MockA(1)
+    third = MockA(2)
+
+    for _ in range(5000):
+        first = MockA(first)
+        second = MockA(second)
+        third = MockA(third)
+
+    assert like(first)(second)
+    assert not like(first)(third)
+
+
+def test_like_of_shared_values():
+    first = MockA(1)
+    second = MockA(1)
+
+    for _ in range(64):
+        first = val(left=first, right=first)
+        second = val(left=second, right=second)
+
+    assert like(first)(second)
+
+
+test_mismatch_path_of = case_of(
+    (lambda: mismatch_path_of(MockA(1))(MockA(1)), None),
+    (lambda: mismatch_path_of(MockA(1))(MockB(1)), tuple()),
+    (lambda: mismatch_path_of(val(a=MockA(1)))(val(a=MockA(2))), ('a', 'a')),
+    (
+        lambda: mismatch_path_of(val(a=val(b=1, c=2)))(val(a=val(b=1, c=3))),
+        ('a', 'c'),
+    ),
+    (lambda: mismatch_path_of(val(a=1))(val(a=1, b=2)), tuple()),
+)
+
+
 test_to_attr = case_of((
     lambda: to_attr('a', lambda a: a + 5)(MockA(3)).a, 8
 ))
@@ -359,6 +577,35 @@ test_type_single_annotating_with_values = case_of(
 )
 
 
+def test_type_annotating_of_one_class():
+    class WithA:
+        def a(self) -> None:
+            ...
+
+    class WithAProperty:
+        a = property(lambda _: 1)
+
+    template = type(a=int)
+
+    assert isinstance(WithA(), template)
+    assert isinstance(WithA(), template)
+    assert isinstance(WithAProperty(), template)
+    assert not isinstance(4, template)
+    assert not isinstance(4, template)
+    assert not isinstance(MockB(1), template)
+    assert isinstance(MockA(1), template)
+
+    template.b = 2
+
+    assert not isinstance(WithA(), template)
+    assert not isinstance(MockA(1), template)
+
+    del template.b
+
+    assert isinstance(WithA(), template)
+    assert isinstance(MockA(1), template)
+
+
 test_type_union_annotating = case_of(
     (lambda: isinstance(val(a=1), type(a=int) | type(b=int)), True),
     (lambda: isinstance(val(b=2), type(a=int) | type(b=int)), True),
@@ -464,6 +711,74 @@ def test_sculpture_default_descriptor():
     assert sculpture.b == 4
 
 
+def test_sculptures_of_one_type():
+    first_original = MockA(1)
+    second_original = MockA(2)
+
+    proxy_of = sculpture_of(b='a', c=MockA.get_a)
+
+    first = proxy_of(first_original)
+    second = proxy_of(second_original)
+
+    assert builtins.type(first) is builtins.type(second)
+    assert type(first) is val
+    assert original_of(first) is first_original
+
+    assert (first.b, first.c, first.a) == (1, 1, 1)
+    assert (second.b, second.c, second.a) == (2, 2, 2)
+
+    first.b = 3
+    first.d = 4
+
+    assert (first_original.a, first_original.d) == (3, 4)
+    assert (second.b, second.c) == (2, 2)
+
+    with raises(AttributeError):
+        first.c = 5
+
+    del first.d
+    assert not hasattr(first_original, "d")
+
+    fixed = first - default_descriptor
+
+    assert fixed.b == 3
+    assert not hasattr(fixed, "a")
+    assert first.a == 3
+
+
+def test_sculptures_with_local_descriptors():
+    def sculpture_with_b_as(number: int) -> val:
+        return sculpture_of(MockA(1), b=lambda _: number)
+
+    first, second = map(sculpture_with_b_as, range(2))
+
+    assert (first.b, second.b) == (0, 1)
+    assert (first.a, second.a) == (1, 1)
+    assert builtins.type(first) not in _sculpture_types
+    assert builtins.type(first) is builtins.type(second)
+
+    first.a = 2
+
+    assert original_of(first).a == 2
+
+
+def test_sculptures_with_module_level_properties():
+    first = sculpture_of(MockA(1), c=property(MockA.get_a))
+    second = sculpture_of(MockA(2), c=property(MockA.get_a))
+
+    assert (first.c, second.c) == (1, 2)
+    assert builtins.type(first) in _sculpture_types
+    assert builtins.type(first) is builtins.type(second)
+
+
+def test_sculpture_repr():
+    sculpture = sculpture_of(MockA(1), b="a")
+
+    assert repr(sculpture).endswith(
+        f"{default_descriptor}=_default_sculpture_descriptor_of>"
+    )
+
+
 def test_struct():
     @dataclass
     class A:
@@ -477,6 +792,22 @@ def test_struct():
     assert struct(A, B) == type(a=int, b=str)
 
 
+def test_struct_of_one_class():
+    class A:
+        a: int
+        b: str = 'b'
+        c: list = field(default_factory=list)
+
+    first = struct(A)(1)
+    second = struct(A)(2)
+
+    first.c.append(3)
+
+    assert first == val(a=1, b='b', c=[3])
+    assert second == val(a=2, b='b', c=list())
+    assert struct(A) == struct(A) == type(a=int) & val(b='b', c=list())
+
+
 def test_obj():
     object = obj(val(b=4), a=lambda self, a: a * self.b)
 
@@ -489,6 +820,34 @@ def test_obj():
     assert (object & val(b=8)).b == 8
 
 
+def test_obj_many():
+    def double(self) -> int:
+        return self.a * 2
+
+    rows = (dict(a=1, b=2), val(a=3, b=4), dict(a=5, b=6, c=lambda self: self.a))
+
+    records = obj.many(rows, d=double)
+
+    assert records == tuple(obj(row, d=double) for row in rows)
+    assert builtins.type(records[0]) is builtins.type(records[1])
+    assert records[2].c() == 5
+    assert records[2].d() == 10
+    assert obj.many(tuple()) == tuple()
+
+
+def test_struct_many():
+    class A:
+        a: int
+
+    class B:
+        b: str = 'b'
+
+    assert struct.many((A, B), c=float) == (
+        type(a=int, c=float),
+        type(c=float) & val(b='b'),
+    )
+
+
 def test_namespace():
     @namespace
     class space:
@@ -19,4 +19,11 @@ test_take = case_of(
         lambda: take[:2]['v'](lambda *args, v: (*args, v))(1, 2, 3, 4, v=-3),
         (1, 2, -3),
     ),
+    (lambda: take[0](lambda *args: args)((1, 2), 3), ((1, 2), )),
+    (lambda: take[1, :1](lambda *args: args)('ab', 'cd'), ('cd', 'ab')),
+    (lambda: take[-1](lambda *args: args)(1, 2, 3), (3, )),
+    (
+        lambda: take(lambda *args, **kwargs: (args, kwargs))(1, v=2),
+        (tuple(), dict()),
+    ),
 )
@@ -46,6 +46,7 @@ test_partially = case_of(
     (lambda: partially(lambda *_, a=...: 16)(), 16),
     (lambda: partially(lambda *_, **__: 16)(), 16),
     (lambda: partially(lambda a, k=0: a + k)(k=4)(60), 64),
+    (lambda: partially(lambda *numbers: numbers, required=2)(1), (1, )),
     (
         lambda: (
             partially(
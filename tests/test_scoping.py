@@ -1,13 +1,15 @@
 from functools import partial
 from typing import Callable, TypeVar
 
-from pytest import mark
+from pytest import mark, raises
 
 from act.scoping import *
 
 
 _R = TypeVar('_R')
 
+_global_value = 4
+
 
 @mark.parametrize(
     "action, result",
@@ -31,3 +33,35 @@ def test_value_in(action: Callable[[], _R], result: _R):
         return action()
 
     assert a() == result
+
+
+def test_value_in_other_scopes():
+    closure_value = 1
+
+    def closure():
+        return closure_value, value_in("closure_value")
+
+    class WithValue:
+        class_value = 2
+        found_class_value = value_in("class_value")
+
+    assert closure() == (1, 1)
+    assert WithValue.found_class_value == 2
+    assert value_in("_global_value") == 4
+    assert value_in("len") is len
+
+
+def test_value_in_without_value():
+    with raises(NameError):
+        value_in("_nonexistent_value")
+
+
+def test_back_scope_in():
+    def a():
+        return b()
+
+    def b():
+        return back_scope_in(1).f_code.co_name, back_scope_in(0).f_code.co_name
+
+    assert a() == ('a', 'b')
+    assert back_scope_in(10_000) is None
@@ -1,5 +1,9 @@
 from functools import partial
+from itertools import count
 
+from pytest import raises
+
+from act.errors import IndexingError
 from act.testing import case_of
 from act.structures import *
 
@@ -130,6 +134,46 @@ test_range_from = case_of(
 )
 
 
+test_interval_set = case_of(
+    (lambda: tuple(IntervalSet()), tuple()),
+    (
+        lambda: tuple(IntervalSet([range(5, 8), range(0, 3)])),
+        (range(3), range(5, 8)),
+    ),
+    (lambda: tuple(IntervalSet([range(0, 3), range(3, 5)])), (range(5), )),
+    (lambda: tuple(IntervalSet([range(4, -1, -1)])), (range(5), )),
+    (lambda: tuple(IntervalSet([range(0, 5, 2)])), (
+        range(0, 1), range(2, 3), range(4, 5)
+    )),
+    (lambda: 4 in IntervalSet([range(0, 3), range(4, 6)]), True),
+    (lambda: 3 in IntervalSet([range(0, 3), range(4, 6)]), False),
+    (
+        lambda: IntervalSet([range(4)]) | [range(2, 6), 8],
+        IntervalSet([range(6), range(8, 9)]),
+    ),
+    (
+        lambda: IntervalSet([range(4), range(6, 10)]) & range(2, 8),
+        IntervalSet([range(2, 4), range(6, 8)]),
+    ),
+    (
+        lambda: IntervalSet([range(10)]) - [3, range(5, 7)],
+        IntervalSet([range(3), range(4, 5), range(7, 10)]),
+    ),
+    (
+        lambda: IntervalSet([range(2, 4), range(6, 7)]).complement(range(10)),
+        IntervalSet([range(2), range(4, 6), range(7, 10)]),
+    ),
+    (
+        lambda: IntervalSet.of([-1, range(-4, 2), slice(None, 2)], limit=10),
+        IntervalSet([range(2), range(6, 10)]),
+    ),
+    (
+        lambda: IntervalSet.of(range(0, 10 ** 12, 3), limit=10),
+        IntervalSet([range(0, 1), range(3, 4), range(6, 7), range(9, 10)]),
+    ),
+)
+
+
 test_marked_ranges_from = case_of(
     (lambda: marked_ranges_from([4]), (filled(range(4, 5)), )),
     (lambda: marked_ranges_from((1, 2)), (filled(range(1, 3)), )),
@@ -144,6 +188,10 @@ test_marked_ranges_from = case_of(
         empty(range(5, 9)), filled(range(9, 12))
     )),
     (lambda: marked_ranges_from(range(600)), (filled(range(600)), )),
+    (lambda: marked_ranges_from([range(0, 3), range(5, 6)]), (
+        filled(range(0, 3)), empty(range(3, 5)), filled(range(5, 6))
+    )),
+    (lambda: marked_ranges_from(tuple()), tuple()),
 )
 
 
@@ -200,6 +248,24 @@ test_to_interval = case_of(
 )
 
 
+test_to_interval_with_sequences = case_of(
+    (
+        lambda: to_interval(slice(2), bytearray.upper, bytearray(b"abcd")),
+        tuple(b"ABcd"),
+    ),
+    (
+        lambda: to_interval([-1, 0], memoryview.tolist, memoryview(b"abcd")),
+        tuple(b"abcd"),
+    ),
+    (
+        lambda: to_interval(range(-2, 0), partial(map, str), [1, 2, 3, 4]),
+        (1, 2, '3', '4'),
+    ),
+    (lambda: to_interval(-100, partial(map, str), [1, 2]), (1, 2)),
+    (lambda: to_interval(empty(1), partial(map, str), [1, 2]), (1, 2)),
+)
+
+
 test_to_interval_via_indexer = case_of(
     (
         lambda: to_interval[2](partial(map, lambda v: v * 10), [-1, 1, 2]),
@@ -224,9 +290,27 @@ test_groups_in = case_of((
 test_indexed = case_of(
     (lambda: tuple(indexed([1, 2, 3], 0, 1)), ((1, 2), (2, 3))),
     (lambda: tuple(indexed([1, 2, 3, 4], 0, 1)), ((1, 2), (2, 3), (3, 4))),
+    (lambda: tuple(indexed([1, 2, 3, 4], 2, 0)), ((3, 1), (4, 2))),
+    (lambda: tuple(indexed([1, 2], 2)), tuple()),
+    (lambda: next(indexed(count(), 0, 2)), (0, 2)),
+    (lambda: tuple(indexed(range(7), 0, 1, step=2)), ((0, 1), (2, 3), (4, 5))),
+    (lambda: tuple(indexed(range(7), 0, step=3)), ((0, ), (3, ), (6, ))),
+    (
+        lambda: tuple(indexed(range(5), 0, 1, batch=3)),
+        (((0, 1), (1, 2), (2, 3)), ((3, 4), )),
+    ),
+    (
+        lambda: next(indexed(count(), 1, batch=2, step=2)),
+        ((1, ), (3, )),
+    ),
 )
 
 
+def test_indexed_without_enough_items():
+    with raises(IndexingError):
+        tuple(indexed([1], 0, 2))
+
+
 test_table_map = case_of((
     lambda: table.map(lambda v: v * 2, dict(a=1, b=2, c=3)), dict(a=2, b=4, c=6)
 ))
@@ -245,3 +329,56 @@ test_table_from_keys = case_of((
 test_table_reversed = case_of((
     lambda: table.reversed(dict(a=1, b=2)), {1: 'a', 2: 'b'}
 ))
+
+
+def test_frozendict():
+    mapping = frozendict(a=1, b=2)
+
+    assert mapping == dict(a=1, b=2)
+    assert mapping.set("c", 3) == dict(a=1, b=2, c=3)
+    assert mapping.delete("a") == dict(b=2)
+    assert mapping == dict(a=1, b=2)
+    assert tuple((mapping | dict(b=4, c=5)).items()) == (
+        ("a", 1), ("b", 4), ("c", 5)
+    )
+    assert hash(mapping) == hash(frozendict(b=2, a=1))
+    assert frozendict(mapping) == mapping
+
+    with raises(KeyError):
+        mapping.delete("c")
+
+
+class _Colliding:
+    def __init__(self, number: int) -> None:
+        self.number = number
+
+    def __hash__(self) -> int:
+        return self.number % 4
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Colliding) and other.number == self.number
+
+
+def test_frozendict_over_trie():
+    keys = (*range(100), *map(_Colliding, range(40)), *map(str, range(50)))
+    table = dict()
+    mapping = frozendict()
+
+    for index, key in enumerate(keys):
+        table[key] = index
+        mapping = mapping.set(key, index)
+
+    for key in keys[::3]:
+        del table[key]
+        mapping = mapping.delete(key)
+
+    for key in keys[::6]:
+        table[key] = None
+        mapping = mapping.set(key, None)
+
+    assert len(mapping) == len(table)
+    assert tuple(mapping.items()) == tuple(table.items())
+    assert tuple(mapping.values()) == tuple(table.values())
+    assert mapping == table
+    assert _Colliding(1000) not in mapping
+    assert mapping.get(_Colliding(4)) == table[_Colliding(4)]
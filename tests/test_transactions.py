@@ -0,0 +1,81 @@
+from act.transactions import *
+from act.monads import bad
+from act.tools import _get
+
+
+class _MockOperation:
+    def __init__(self, number: int, rollbacks: list[int]):
+        self.number = number
+        self._rollbacks = rollbacks
+
+    def __call__(self, value: int) -> int:
+        return value
+
+    def rollback(self) -> int:
+        self._rollbacks.append(self.number)
+
+        return self.number
+
+
+def test_do_rollbacks_in_reverse_order():
+    rollbacks = list()
+    first, second = (_MockOperation(n, rollbacks) for n in range(2))
+
+    @do(rollbackable.optionally, else_=do.rollbacks)
+    def action(do: Do) -> None:
+        do(first)(1)
+        do(second)(2)
+        do(first)(3)
+
+        return do(_get)(None)
+
+    assert action() == (1, 0)
+    assert rollbacks == [1, 0]
+
+
+def test_do_rollbacks_of_child_cursors():
+    rollbacks = list()
+    first, second, third = (_MockOperation(n, rollbacks) for n in range(3))
+
+    @do(rollbackable.maybe, rollbackable.optionally, else_=do.rollbacks)
+    def action(do: Do) -> None:
+        maybe, optionally = do
+
+        do(first)(1)
+        maybe(second)(2)
+        optionally(third)(3)
+
+        return maybe(_get)(bad(None))
+
+    assert action() == (2, 1, 0)
+    assert rollbacks == [2, 1, 0]
+
+
+def test_do_without_rollback():
+    rollbacks = list()
+    operation = _MockOperation(0, rollbacks)
+
+    @do(rollbackable.optionally)
+    def action(do: Do, value: int) -> int:
+        return do(operation)(value) + 1
+
+    assert action(1) == 2
+    assert rollbacks == list()
+
+
+def test_transaction_cursor_operations():
+    cursor = Do(_get)
+    child, = cursor
+    operations = [_MockOperation(n, list()) for n in range(100)]
+
+    for operation in operations * 2:
+        cursor(operation)
+
+    child(operations[0])
+    child(_get)
+
+    assert len(cursor.network_operations) == 101
+    assert tuple(cursor.network_operations) == (*operations, _get)
+    assert cursor._operations == tuple(operations)
+    assert child._operations == (_get, )
+    assert child.network_operations is cursor.network_operations